@@ -11,6 +11,10 @@ setup(
         "jinja2>=3.1.0",
         "python-multipart>=0.0.6",
         "websockets>=12.0",
+        "aiofiles>=23.0.0",
+        "zipstream-ng>=1.7.0",
+        "cachetools>=5.3.0",
+        "orjson>=3.9.0",
         "typer[all]>=0.9.0",
         "rich>=13.0.0",
         "pyyaml>=6.0.0",
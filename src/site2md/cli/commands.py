@@ -49,7 +49,8 @@ async def crawl_command(config: Dict[str, Any]) -> None:
         ) as progress:
             task = progress.add_task("Crawling website...", total=None)
             
-            stats = await crawler.crawl()
+            async with crawler:
+                stats = await crawler.crawl()
             
             progress.update(task, description="Crawl completed!")
         
@@ -1,16 +1,33 @@
 """Configuration management for Site2MD."""
 
+import copy
+import functools
+import json
 import os
+import pickle
+import sys
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
 
 import yaml
 
+try:
+    # libyaml-backed loader; much faster than the pure-Python SafeLoader
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
 from ..utils.exceptions import ConfigError
 from ..utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Parsed config files remembered until their mtime or size changes
+CONFIG_FILE_CACHE_SIZE = 32
+
+# Opt-in pickle sidecar (<config>.pkl) so repeat CLI runs skip YAML parsing
+CONFIG_PICKLE_CACHE = os.environ.get("SITE2MD_CONFIG_CACHE") == "1"
+
 DEFAULT_CONFIG = {
     "start_urls": [],
     "scope": {
@@ -60,19 +77,34 @@ DEFAULT_CONFIG = {
     },
 }
 
+# Unpickling a snapshot is a faster deep copy than copy.deepcopy
+_DEFAULT_CONFIG_BLOB = pickle.dumps(DEFAULT_CONFIG, protocol=pickle.HIGHEST_PROTOCOL)
+
 
 def load_config(
     config_file: Optional[Path] = None,
     **cli_overrides: Any
 ) -> Dict[str, Any]:
     """Load configuration from file and CLI arguments."""
-    config = DEFAULT_CONFIG.copy()
+    # Fresh nested dicts each call, so overrides never leak into DEFAULT_CONFIG
+    config = pickle.loads(_DEFAULT_CONFIG_BLOB)
     
     # Load from file if provided
-    if config_file and config_file.exists():
+    # One stat() both checks existence and keys the parse cache
+    stat_result = None
+    if config_file:
+        try:
+            stat_result = os.stat(config_file)
+        except (FileNotFoundError, NotADirectoryError):
+            pass
+        except OSError as e:
+            raise ConfigError(f"Error reading config file {config_file}: {e}")
+
+    if stat_result is not None:
         try:
-            with open(config_file, 'r', encoding='utf-8') as f:
-                file_config = yaml.safe_load(f) or {}
+            file_config = copy.deepcopy(_parse_config_file(
+                str(config_file), stat_result.st_mtime_ns, stat_result.st_size
+            ))
             config = _merge_config(config, file_config)
             logger.debug(f"Loaded configuration from {config_file}")
         except yaml.YAMLError as e:
@@ -86,20 +118,85 @@ def load_config(
     # Validate and normalize
     config = _validate_config(config)
     
-    return config
+    return _intern_keys(config)
+
+
+@functools.lru_cache(maxsize=CONFIG_FILE_CACHE_SIZE)
+def _parse_config_file(path: str, mtime_ns: int, size: int) -> Any:
+    """Parse a YAML config file; callers get a copy, the cached tree stays pristine."""
+    if not CONFIG_PICKLE_CACHE:
+        return _load_yaml(Path(path))
+
+    sidecar = path + ".pkl"
+    try:
+        with open(sidecar, 'rb') as f:
+            cached_mtime_ns, cached_size, parsed = pickle.load(f)
+        if (cached_mtime_ns, cached_size) == (mtime_ns, size):
+            return parsed
+    except Exception:
+        pass  # Missing, stale format or corrupt: reparse and rewrite
+
+    parsed = _load_yaml(Path(path))
+    tmp_path = f"{sidecar}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, 'wb') as f:
+            pickle.dump((mtime_ns, size, parsed), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, sidecar)
+    except OSError as e:
+        logger.debug(f"Cannot write config cache {sidecar}: {e}")
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+    return parsed
+
+
+def _load_yaml(path: Path) -> Any:
+    """Load a config file, taking the json fast path for JSON documents."""
+    data = path.read_bytes()
+    # JSON is valid YAML; generated configs are often plain JSON objects
+    if data.lstrip()[:1] == b'{':
+        try:
+            return json.loads(data)
+        except ValueError:
+            pass
+    return yaml.load(data, Loader=SafeLoader) or {}
 
 
 def _merge_config(base: Dict[str, Any], override: Dict[str, Any]) -> Dict[str, Any]:
-    """Deep merge configuration dictionaries."""
-    result = base.copy()
+    """Deep merge override into base in place; both must be private copies."""
+    stack = [(base, override)]
+    while stack:
+        target, source = stack.pop()
+        # Only walk the override's keys; untouched defaults are never visited
+        for key, value in source.items():
+            current = target.get(key)
+            if isinstance(current, dict) and isinstance(value, dict):
+                stack.append((current, value))
+            else:
+                target[key] = value
     
-    for key, value in override.items():
-        if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-            result[key] = _merge_config(result[key], value)
-        else:
-            result[key] = value
+    return base
+
+
+def _intern_keys(config: Dict[str, Any]) -> Dict[str, Any]:
+    """Intern string keys in place so hot config lookups hit the identity fast path."""
+    stack: List[Any] = [config]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            # Rebuild rather than pop/reinsert so key order is preserved
+            items = [
+                (sys.intern(key) if type(key) is str else key, value)
+                for key, value in node.items()
+            ]
+            node.clear()
+            node.update(items)
+            stack.extend(node.values())
+        elif isinstance(node, list):
+            stack.extend(node)
     
-    return result
+    return config
 
 
 def _apply_cli_overrides(config: Dict[str, Any], overrides: Dict[str, Any]) -> Dict[str, Any]:
@@ -188,9 +285,14 @@ def _validate_config(config: Dict[str, Any]) -> Dict[str, Any]:
     
     # Validate auth files exist if specified
     auth = config["auth"]
-    for file_key in ["cookies_file", "headers_file"]:
-        if auth[file_key] and not Path(auth[file_key]).exists():
-            raise ConfigError(f"Auth file not found: {auth[file_key]}")
+    auth_paths = [auth["cookies_file"], auth["headers_file"]]
+    for auth_path in filter(None, auth_paths):
+        try:
+            os.stat(auth_path)
+        except (FileNotFoundError, NotADirectoryError):
+            raise ConfigError(f"Auth file not found: {auth_path}")
+        except OSError as e:
+            raise ConfigError(f"Cannot access auth file {auth_path}: {e}")
     
     if auth["playwright_context_dir"]:
         ctx_dir = Path(auth["playwright_context_dir"])
@@ -1,9 +1,13 @@
 """Main crawler orchestrator for Site2MD."""
 
 import asyncio
+import itertools
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Set
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 from rich.progress import Progress, TaskID
 
@@ -12,16 +16,38 @@ from ..fetch.playwright_client import PlaywrightClient
 from ..process.converter import MarkdownConverter
 from ..process.extractor import ContentExtractor
 from ..storage.filesystem import FileSystemManager
-from ..storage.manifest import CrawlManifest
+from ..storage.manifest import CrawlManifest, content_digest
 from ..utils.exceptions import CrawlError
 from ..utils.logging import CrawlStatsLogger, get_logger
-from ..utils.validation import normalize_url, should_crawl_url
+from ..utils.validation import normalize_url, should_crawl_urls
 from .discovery import URLDiscovery
 from .robots import RobotsChecker
 from .url_manager import URLManager
 
 logger = get_logger(__name__)
 
+# Pages converted inline before a worker pool is worth its spawn cost
+# (each spawned worker re-imports trafilatura and lxml)
+PROCESS_POOL_MIN_PAGES = 16
+
+# Per-process extractor, converter and event loop, set up by _init_worker
+_worker_pipeline: Optional[Tuple[ContentExtractor, MarkdownConverter, asyncio.AbstractEventLoop]] = None
+
+
+def _init_worker(config: Dict[str, Any]) -> None:
+    """Build a worker's pipeline once, so pages are dispatched without the config."""
+    global _worker_pipeline
+    _worker_pipeline = (ContentExtractor(config), MarkdownConverter(config), asyncio.new_event_loop())
+
+
+def _extract_and_convert(html: str, url: str, headers: Dict[str, str]) -> str:
+    """Extract and convert one page to Markdown; runs in a worker process."""
+    if _worker_pipeline is None:
+        raise RuntimeError("Worker pipeline not initialized; start the pool with _init_worker")
+    extractor, converter, loop = _worker_pipeline
+    extracted = loop.run_until_complete(extractor.extract(html, url))
+    return loop.run_until_complete(converter.convert(extracted, url, headers))
+
 
 class Crawler:
     """Main crawler that orchestrates the crawling process."""
@@ -40,23 +66,34 @@ class Crawler:
         self.markdown_converter = MarkdownConverter(config)
         self.filesystem = FileSystemManager(config)
         self.manifest = CrawlManifest(config["output"]["directory"])
+        self.process_pool: Optional[ProcessPoolExecutor] = None
+        # Nesting depth of async with blocks; only the outermost sets up and tears down
+        self._context_depth = 0
+        self._pages_converted = 0
         
         # State
         self.crawled_urls: Set[str] = set()
         self.failed_urls: Set[str] = set()
+        self.written_md: Set[Path] = set()
         
     async def __aenter__(self):
-        """Async context manager entry."""
+        """Async context manager entry; re-entering an open crawler only nests."""
+        if self._context_depth:
+            self._context_depth += 1
+            return self
         await self.http_client.__aenter__()
         if self.config["render"]["enabled"]:
             self.playwright_client = PlaywrightClient(self.config)
             await self.playwright_client.__aenter__()
         await self.manifest.initialize()
+        self._context_depth = 1
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        """Async context manager exit."""
-        await self.cleanup()
+        """Async context manager exit; the outermost exit cleans up."""
+        self._context_depth = max(self._context_depth - 1, 0)
+        if not self._context_depth:
+            await self.cleanup()
     
     async def cleanup(self):
         """Clean up resources."""
@@ -64,6 +101,11 @@ class Crawler:
             await self.http_client.close()
         if self.playwright_client:
             await self.playwright_client.__aexit__(None, None, None)
+        await self.manifest.close()
+        if self.process_pool:
+            self.process_pool.shutdown(wait=False, cancel_futures=True)
+            self.process_pool = None
+        self._context_depth = 0
     
     async def preview_urls(self) -> List[str]:
         """Preview URLs that would be crawled without actually crawling."""
@@ -76,16 +118,14 @@ class Crawler:
         discovered_urls = await self.url_discovery.discover_urls(start_urls)
         
         # Filter URLs based on scope rules
-        filtered_urls = []
-        for url in discovered_urls:
-            if should_crawl_url(
-                url,
-                start_urls[0],  # Use first URL as base
-                self.config["scope"]["allow_subdomains"],
-                self.config["scope"]["include"],
-                self.config["scope"]["exclude"],
-            ):
-                filtered_urls.append(url)
+        in_scope = should_crawl_urls(
+            discovered_urls,
+            start_urls[0],  # Use first URL as base
+            self.config["scope"]["allow_subdomains"],
+            self.config["scope"]["include"],
+            self.config["scope"]["exclude"],
+        )
+        filtered_urls = list(itertools.compress(discovered_urls, in_scope))
         
         # Apply limits
         max_pages = self.config["limits"]["max_pages"]
@@ -97,10 +137,10 @@ class Crawler:
     async def crawl(self) -> Dict[str, Any]:
         """Execute the full crawl process."""
         logger.info("Starting crawl process")
-        self.stats_logger.stats["start_time"] = datetime.now()
+        self.stats_logger.start_time = datetime.now()
         
         try:
-            # Initialize
+            # Initialize; a no-op nesting when the caller already holds the crawler open
             async with self:
                 start_urls = [normalize_url(url) for url in self.config["start_urls"]]
                 
@@ -147,7 +187,7 @@ class Crawler:
             raise CrawlError(f"Crawl failed: {e}") from e
         
         finally:
-            self.stats_logger.stats["end_time"] = datetime.now()
+            self.stats_logger.end_time = datetime.now()
         
         return self.stats_logger.get_stats()
     
@@ -217,22 +257,20 @@ class Crawler:
             if not content:
                 return
             
-            # Extract main content
-            extracted = await self.content_extractor.extract(content, url)
-            
-            # Convert to Markdown
-            markdown = await self.markdown_converter.convert(
-                extracted, url, response.get("headers", {})
+            # Extract main content and convert to Markdown
+            markdown = await self._extract_and_convert(
+                content, url, response.get("headers", {})
             )
             
             # Save to filesystem
             filepath = await self.filesystem.save_page(url, markdown)
+            self.written_md.add(filepath)
             
             # Update manifest
             await self.manifest.update_page(
                 url=url,
                 filepath=filepath,
-                content_hash=hash(markdown),
+                content_hash=content_digest(markdown),
                 etag=response.get("headers", {}).get("etag"),
                 last_modified=response.get("headers", {}).get("last-modified"),
             )
@@ -243,6 +281,32 @@ class Crawler:
             logger.error(f"Failed to process content for {url}: {e}")
             raise
     
+    async def _extract_and_convert(self, content: str, url: str, headers: Dict[str, str]) -> str:
+        """Run extraction and conversion in the process pool, or inline without one."""
+        if self.process_pool is None and self._pages_converted >= PROCESS_POOL_MIN_PAGES:
+            self.process_pool = self._start_process_pool()
+        self._pages_converted += 1
+        
+        if self.process_pool is None:
+            extracted = await self.content_extractor.extract(content, url)
+            return await self.markdown_converter.convert(extracted, url, headers)
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.process_pool, _extract_and_convert, content, url, headers
+        )
+    
+    def _start_process_pool(self) -> ProcessPoolExecutor:
+        """Start spawned workers for CPU-bound extraction once a crawl is big enough."""
+        # Spawned rather than forked, since the web app runs crawls in threads
+        workers = min(os.cpu_count() or 1, self.config["fetch"]["concurrency"])
+        return ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(self.config,),
+        )
+    
     async def _generate_site_readme(self) -> None:
         """Generate a site-level README with crawl results."""
         try:
@@ -1,18 +1,105 @@
 """URL discovery via sitemaps and BFS crawling."""
 
 import asyncio
+import hashlib
+import io
+import itertools
+import json
+import os
 import re
-from typing import Any, Dict, List, Set
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Set, Tuple
 from urllib.parse import urljoin, urlparse
-from xml.etree import ElementTree as ET
+
+from lxml import etree
+from trafilatura.utils import load_html
 
 from ..fetch.http_client import HTTPClient
 from ..utils.exceptions import CrawlError
 from ..utils.logging import get_logger
-from ..utils.validation import normalize_url, should_crawl_url
+from ..utils.validation import normalize_url, should_crawl_urls
 
 logger = get_logger(__name__)
 
+SITEMAP_NS = '{http://www.sitemaps.org/schemas/sitemap/0.9}'
+SITEMAP_URL_TAG = SITEMAP_NS + 'url'
+SITEMAP_INDEX_TAG = SITEMAP_NS + 'sitemap'
+
+# Opt-in cache of parsed sitemaps kept across runs, keyed by a digest of
+# the document
+SITEMAP_CACHE = os.environ.get("SITE2MD_SITEMAP_CACHE") == "1"
+SITEMAP_CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "site2md" / "sitemaps"
+SITEMAP_CACHE_ENTRIES = 512
+# Cache writes between prune passes over the cache directory
+SITEMAP_CACHE_PRUNE_INTERVAL = 64
+
+_sitemap_cache_writes = 0
+
+# Runs on every crawled page, so compile it once
+_ANCHOR_HREFS = etree.XPath('//a/@href')
+
+
+def iter_sitemap_locs(xml_content: str) -> Iterator[Tuple[bool, str]]:
+    """Stream (is_child_sitemap, loc) pairs, freeing each entry once read."""
+    source = io.BytesIO(xml_content.encode('utf-8'))
+    events = etree.iterparse(
+        source,
+        events=('end',),
+        tag=(SITEMAP_URL_TAG, SITEMAP_INDEX_TAG),
+        encoding='utf-8',
+        resolve_entities=False,
+    )
+    for _, elem in events:
+        loc = elem.findtext(SITEMAP_NS + 'loc')
+        if loc and loc.strip():
+            yield elem.tag == SITEMAP_INDEX_TAG, loc.strip()
+        
+        # Drop the entry and any already-processed siblings
+        elem.clear(keep_tail=True)
+        while elem.getprevious() is not None:
+            del elem.getparent()[0]
+
+
+def cached_sitemap_locs(xml_content: str) -> List[Tuple[bool, str]]:
+    """Return iter_sitemap_locs results, reusing the parse of an unchanged document."""
+    global _sitemap_cache_writes
+    if not SITEMAP_CACHE:
+        return list(iter_sitemap_locs(xml_content))
+    
+    digest = hashlib.blake2b(xml_content.encode('utf-8'), digest_size=16).hexdigest()
+    cache_path = SITEMAP_CACHE_DIR / digest
+    try:
+        return [(is_child, loc) for is_child, loc in json.loads(cache_path.read_bytes())]
+    except (OSError, ValueError):
+        pass
+    
+    locs = list(iter_sitemap_locs(xml_content))
+    try:
+        SITEMAP_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        cache_path.write_text(json.dumps(locs), encoding='utf-8')
+        # Prune on the first write and then periodically, not on every parse
+        if _sitemap_cache_writes % SITEMAP_CACHE_PRUNE_INTERVAL == 0:
+            _prune_sitemap_cache()
+        _sitemap_cache_writes += 1
+    except OSError as e:
+        logger.debug(f"Cannot write sitemap cache {cache_path}: {e}")
+    return locs
+
+
+def _prune_sitemap_cache() -> None:
+    """Drop the oldest cached sitemaps beyond SITEMAP_CACHE_ENTRIES."""
+    with os.scandir(SITEMAP_CACHE_DIR) as entries:
+        files = [entry for entry in entries if entry.is_file(follow_symlinks=False)]
+    if len(files) <= SITEMAP_CACHE_ENTRIES:
+        return
+    
+    files.sort(key=lambda entry: entry.stat().st_mtime)
+    for entry in files[:len(files) - SITEMAP_CACHE_ENTRIES]:
+        try:
+            os.unlink(entry.path)
+        except OSError:
+            pass
+
 
 class URLDiscovery:
     """Discovers URLs via sitemaps and breadth-first search."""
@@ -30,12 +117,14 @@ class URLDiscovery:
         for url in start_urls:
             self.discovered_urls.add(url)
         
-        # Discover via sitemaps first if enabled
-        if self.config.get("discovery", {}).get("sitemap_first", True):
-            await self._discover_from_sitemaps(start_urls)
-        
-        # Discover via BFS crawling
-        await self._discover_via_bfs(start_urls)
+        # One client (and connection pool) for the whole discovery pass
+        async with self.http_client:
+            # Discover via sitemaps first if enabled
+            if self.config.get("discovery", {}).get("sitemap_first", True):
+                await self._discover_from_sitemaps(start_urls)
+            
+            # Discover via BFS crawling
+            await self._discover_via_bfs(start_urls)
         
         # Convert to sorted list (helps with consistency)
         urls = sorted(list(self.discovered_urls))
@@ -66,24 +155,23 @@ class URLDiscovery:
     async def _parse_sitemap(self, sitemap_url: str, base_url: str) -> None:
         """Parse a sitemap XML file."""
         try:
-            async with self.http_client:
-                response = await self.http_client.fetch(sitemap_url)
-                
-                if not response or response.get("status_code", 0) >= 400:
-                    return
-                
-                content = response.get("content", "")
-                if not content:
-                    return
-                
-                # Handle robots.txt case - extract sitemap references
-                if sitemap_url.endswith("robots.txt"):
-                    await self._parse_robots_sitemaps(content, base_url)
-                    return
-                
-                # Parse XML sitemap
-                await self._parse_xml_sitemap(content, base_url)
-                
+            response = await self.http_client.fetch(sitemap_url)
+            
+            if not response or response.get("status_code", 0) >= 400:
+                return
+            
+            content = response.get("content", "")
+            if not content:
+                return
+            
+            # Handle robots.txt case - extract sitemap references
+            if sitemap_url.endswith("robots.txt"):
+                await self._parse_robots_sitemaps(content, base_url)
+                return
+            
+            # Parse XML sitemap
+            await self._parse_xml_sitemap(content, base_url)
+            
         except Exception as e:
             logger.debug(f"Failed to parse sitemap {sitemap_url}: {e}")
     
@@ -101,50 +189,47 @@ class URLDiscovery:
     async def _parse_xml_sitemap(self, xml_content: str, base_url: str) -> None:
         """Parse XML sitemap content."""
         try:
-            root = ET.fromstring(xml_content)
-            
-            # Handle namespace
-            namespaces = {
-                'sm': 'http://www.sitemaps.org/schemas/sitemap/0.9'
-            }
-            
-            # Check if this is a sitemap index
-            sitemaps = root.findall('.//sm:sitemap', namespaces)
-            if sitemaps:
-                # This is a sitemap index - parse child sitemaps
-                for sitemap in sitemaps:
-                    loc_elem = sitemap.find('sm:loc', namespaces)
-                    if loc_elem is not None and loc_elem.text:
-                        child_url = normalize_url(loc_elem.text.strip())
-                        await self._parse_sitemap(child_url, base_url)
-                return
+            child_sitemaps = []
+            candidates = []
+            url_count = 0
+            
+            for is_child_sitemap, loc in cached_sitemap_locs(xml_content):
+                if is_child_sitemap:
+                    # Sitemap index entry - parsed after this document is done
+                    child_sitemaps.append(loc)
+                    continue
+                
+                url_count += 1
+                try:
+                    candidates.append(normalize_url(loc))
+                except Exception as e:
+                    logger.debug(f"Invalid URL in sitemap {loc}: {e}")
+            
+            # Scope-check the whole sitemap in one batch
+            self.discovered_urls.update(itertools.compress(
+                candidates, self._in_scope(candidates, base_url)
+            ))
+            
+            for child_url in child_sitemaps:
+                await self._parse_sitemap(normalize_url(child_url), base_url)
             
-            # This is a regular sitemap - extract URLs
-            urls = root.findall('.//sm:url', namespaces)
-            for url_elem in urls:
-                loc_elem = url_elem.find('sm:loc', namespaces)
-                if loc_elem is not None and loc_elem.text:
-                    url = loc_elem.text.strip()
-                    try:
-                        normalized_url = normalize_url(url)
-                        if should_crawl_url(
-                            normalized_url,
-                            base_url,
-                            self.config["scope"]["allow_subdomains"],
-                            self.config["scope"]["include"],
-                            self.config["scope"]["exclude"],
-                        ):
-                            self.discovered_urls.add(normalized_url)
-                    except Exception as e:
-                        logger.debug(f"Invalid URL in sitemap {url}: {e}")
-            
-            logger.debug(f"Found {len(urls)} URLs in sitemap")
-            
-        except ET.ParseError as e:
+            logger.debug(f"Found {url_count} URLs in sitemap")
+            
+        except etree.XMLSyntaxError as e:
             logger.debug(f"Failed to parse XML sitemap: {e}")
         except Exception as e:
             logger.warning(f"Error processing sitemap: {e}")
     
+    def _in_scope(self, urls: List[str], base_url: str) -> List[bool]:
+        """Scope mask for a batch of normalized URLs."""
+        return should_crawl_urls(
+            urls,
+            base_url,
+            self.config["scope"]["allow_subdomains"],
+            self.config["scope"]["include"],
+            self.config["scope"]["exclude"],
+        )
+    
     async def _discover_via_bfs(self, start_urls: List[str]) -> None:
         """Discover URLs via breadth-first search crawling."""
         if not self.config.get("discovery", {}).get("bfs_enabled", True):
@@ -191,18 +276,17 @@ class URLDiscovery:
     async def _extract_links_from_page(self, url: str, base_url: str) -> List[str]:
         """Extract links from a single page."""
         try:
-            async with self.http_client:
-                response = await self.http_client.fetch(url)
-                
-                if not response or response.get("status_code", 0) >= 400:
-                    return []
-                
-                content = response.get("content", "")
-                if not content:
-                    return []
-                
-                return self._extract_links_from_html(content, url, base_url)
-                
+            response = await self.http_client.fetch(url)
+            
+            if not response or response.get("status_code", 0) >= 400:
+                return []
+            
+            content = response.get("content", "")
+            if not content:
+                return []
+            
+            return self._extract_links_from_html(content, url, base_url)
+            
         except Exception as e:
             logger.debug(f"Failed to extract links from {url}: {e}")
             return []
@@ -210,14 +294,14 @@ class URLDiscovery:
     def _extract_links_from_html(self, html_content: str, current_url: str, base_url: str) -> List[str]:
         """Extract links from HTML content."""
         try:
-            from bs4 import BeautifulSoup
-            
-            soup = BeautifulSoup(html_content, 'html.parser')
-            links = []
+            tree = load_html(html_content)
+            if tree is None:
+                return []
+            candidates = set()
             
             # Extract href attributes from anchor tags
-            for a_tag in soup.find_all('a', href=True):
-                href = a_tag['href'].strip()
+            for href in _ANCHOR_HREFS(tree):
+                href = href.strip()
                 
                 # Skip empty, javascript, mailto, tel links
                 if not href or href.startswith(('javascript:', 'mailto:', 'tel:', '#')):
@@ -226,22 +310,14 @@ class URLDiscovery:
                 try:
                     # Convert to absolute URL
                     absolute_url = urljoin(current_url, href)
-                    normalized_url = normalize_url(absolute_url)
-                    
-                    # Check if should crawl
-                    if should_crawl_url(
-                        normalized_url,
-                        base_url,
-                        self.config["scope"]["allow_subdomains"],
-                        self.config["scope"]["include"],
-                        self.config["scope"]["exclude"],
-                    ):
-                        links.append(normalized_url)
+                    candidates.add(normalize_url(absolute_url))
                 
                 except Exception as e:
                     logger.debug(f"Invalid link {href} on {current_url}: {e}")
             
-            return list(set(links))  # Remove duplicates
+            # Deduplicated first, then scope-checked in one batch
+            candidates = list(candidates)
+            return list(itertools.compress(candidates, self._in_scope(candidates, base_url)))
             
         except Exception as e:
             logger.debug(f"Failed to parse HTML for links: {e}")
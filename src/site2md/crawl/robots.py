@@ -1,9 +1,9 @@
 """Robots.txt parsing and compliance checking."""
 
 import asyncio
-from typing import Any, Dict, Optional
-from urllib.parse import urljoin, urlparse
-from urllib.robotparser import RobotFileParser
+import re
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import quote, unquote, urljoin, urlparse
 
 from ..fetch.http_client import HTTPClient
 from ..utils.exceptions import RobotsError
@@ -11,6 +11,106 @@ from ..utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Characters left unescaped when comparing rule patterns with URL paths
+_PATH_SAFE_CHARS = "/?=&;:@+,!~*$'()"
+
+
+def _normalize_path(path: str) -> str:
+    """Percent-encode a path the same way for rules and URLs."""
+    return quote(unquote(path), safe=_PATH_SAFE_CHARS)
+
+
+def _pattern_to_regex(pattern: str) -> str:
+    """Translate a robots.txt path pattern (* and trailing $) to a regex."""
+    anchored = pattern.endswith('$')
+    if anchored:
+        pattern = pattern[:-1]
+    regex = '.*'.join(re.escape(part) for part in pattern.split('*'))
+    return regex + '$' if anchored else regex
+
+
+class RobotsRules:
+    """Allow/Disallow rules for one user agent, matched with a single regex scan."""
+
+    def __init__(self, rules: Iterable[Tuple[bool, str]], crawl_delay: Optional[float] = None):
+        # Longest pattern wins and Allow wins ties, so the first match decides
+        ordered = sorted(
+            ((allow, _normalize_path(path)) for allow, path in rules if path),
+            key=lambda rule: (-len(rule[1]), not rule[0]),
+        )
+        self.crawl_delay = crawl_delay
+        self._rules: List[Tuple[bool, re.Pattern]] = [
+            (allow, re.compile(_pattern_to_regex(path))) for allow, path in ordered
+        ]
+        # Most URLs match no rule at all; answer those with one scan
+        self._any_rule: Optional[re.Pattern] = None
+        if ordered:
+            self._any_rule = re.compile(
+                '|'.join(f'(?:{_pattern_to_regex(path)})' for _, path in ordered)
+            )
+
+    @classmethod
+    def parse(cls, content: str, user_agent: str) -> "RobotsRules":
+        """Parse robots.txt, keeping the groups that apply to user_agent."""
+        agent_token = user_agent.split('/')[0].lower()
+        groups: List[Tuple[List[str], List[Tuple[bool, str]], List[float]]] = []
+        in_agent_lines = False
+
+        for line in content.splitlines():
+            line = line.split('#', 1)[0].strip()
+            if ':' not in line:
+                continue
+            key, value = line.split(':', 1)
+            key = key.strip().lower()
+            value = value.strip()
+
+            if key == 'user-agent':
+                if not in_agent_lines:
+                    groups.append(([], [], []))
+                    in_agent_lines = True
+                groups[-1][0].append(value.lower())
+                continue
+
+            in_agent_lines = False
+            if not groups:
+                continue
+            if key in ('allow', 'disallow'):
+                groups[-1][1].append((key == 'allow', value))
+            elif key == 'crawl-delay':
+                try:
+                    groups[-1][2].append(float(value))
+                except ValueError:
+                    pass
+
+        # Groups naming this agent take precedence over the * group
+        matching = [
+            group for group in groups
+            if any(agent != '*' and agent in agent_token for agent in group[0])
+        ]
+        if not matching:
+            matching = [group for group in groups if '*' in group[0]]
+
+        rules = [rule for group in matching for rule in group[1]]
+        delays = [delay for group in matching for delay in group[2]]
+        return cls(rules, delays[0] if delays else None)
+
+    def can_fetch(self, url: str) -> bool:
+        """Return whether the URL's path and query are allowed."""
+        parsed = urlparse(url)
+        if parsed.path == '/robots.txt':
+            return True
+
+        target = _normalize_path(parsed.path or '/')
+        if parsed.query:
+            target += '?' + parsed.query
+
+        if self._any_rule is None or not self._any_rule.match(target):
+            return True
+        for allow, pattern in self._rules:
+            if pattern.match(target):
+                return allow
+        return True
+
 
 class RobotsChecker:
     """Handles robots.txt parsing and URL checking."""
@@ -18,7 +118,7 @@ class RobotsChecker:
     def __init__(self, config: Dict[str, Any]):
         self.config = config
         self.http_client = HTTPClient(config)
-        self.robots_cache: Dict[str, Optional[RobotFileParser]] = {}
+        self.robots_cache: Dict[str, Optional[RobotsRules]] = {}
         self.user_agent = config["fetch"]["user_agent"]
         self.respect_robots = config["fetch"]["respect_robots"]
 
@@ -39,7 +139,7 @@ class RobotsChecker:
                 return True
 
             # Check if URL is allowed
-            return robots.can_fetch(self.user_agent, url)
+            return robots.can_fetch(url)
 
         except Exception as e:
             logger.warning(f"Error checking robots.txt for {url}: {e}")
@@ -61,14 +161,13 @@ class RobotsChecker:
                 return 0.0
 
             # Get crawl delay for our user agent
-            delay = robots.crawl_delay(self.user_agent)
-            return float(delay) if delay else 0.0
+            return robots.crawl_delay or 0.0
 
         except Exception as e:
             logger.debug(f"Error getting crawl delay for {url}: {e}")
             return 0.0
 
-    async def _get_robots(self, domain_key: str) -> Optional[RobotFileParser]:
+    async def _get_robots(self, domain_key: str) -> Optional[RobotsRules]:
         """Get robots.txt for domain, with caching."""
         if domain_key in self.robots_cache:
             return self.robots_cache[domain_key]
@@ -91,9 +190,7 @@ class RobotsChecker:
                     return None
 
                 # Parse robots.txt content
-                robots = RobotFileParser()
-                robots.set_url(robots_url)
-                robots.read(content.splitlines())
+                robots = RobotsRules.parse(content, self.user_agent)
                 self.robots_cache[domain_key] = robots
 
                 logger.debug(f"Parsed robots.txt for {domain_key}")
@@ -84,35 +84,38 @@ class HTTPClient:
                 
                 logger.debug(f"Fetching {url} (attempt {attempt + 1})")
                 
-                response = await self.client.get(url, headers=self.headers)
+                # Stream the response so bodies are only downloaded when used
+                rate_limit_delay = 0.0
+                async with self.client.stream("GET", url, headers=self.headers) as response:
+                    # Handle different status codes
+                    if response.status_code == 200:
+                        return await self._process_response(response, url)
+                    elif response.status_code == 429:  # Rate limited
+                        retry_after = response.headers.get("retry-after")
+                        if retry_after and attempt < max_retries - 1:
+                            rate_limit_delay = min(float(retry_after), 60.0)  # Cap at 60 seconds
+                    elif response.status_code in (301, 302, 303, 307, 308):
+                        # Redirects are handled automatically by httpx
+                        return await self._process_response(response, url)
+                    elif response.status_code >= 500:
+                        # Server error - retry
+                        if attempt < max_retries - 1:
+                            logger.warning(f"Server error {response.status_code} for {url}, retrying")
+                            continue
+                    else:
+                        # Client error - don't retry
+                        logger.warning(f"HTTP {response.status_code} for {url}")
+                        return {
+                            "status_code": response.status_code,
+                            "content": "",
+                            "headers": dict(response.headers),
+                            "url": str(response.url),
+                        }
                 
-                # Handle different status codes
-                if response.status_code == 200:
-                    return await self._process_response(response, url)
-                elif response.status_code == 429:  # Rate limited
-                    retry_after = response.headers.get("retry-after")
-                    if retry_after and attempt < max_retries - 1:
-                        delay = min(float(retry_after), 60.0)  # Cap at 60 seconds
-                        logger.warning(f"Rate limited for {url}, waiting {delay}s")
-                        await asyncio.sleep(delay)
-                        continue
-                elif response.status_code in (301, 302, 303, 307, 308):
-                    # Redirects are handled automatically by httpx
-                    return await self._process_response(response, url)
-                elif response.status_code >= 500:
-                    # Server error - retry
-                    if attempt < max_retries - 1:
-                        logger.warning(f"Server error {response.status_code} for {url}, retrying")
-                        continue
-                else:
-                    # Client error - don't retry
-                    logger.warning(f"HTTP {response.status_code} for {url}")
-                    return {
-                        "status_code": response.status_code,
-                        "content": "",
-                        "headers": dict(response.headers),
-                        "url": str(response.url),
-                    }
+                # Wait out rate limiting after the connection is released
+                if rate_limit_delay:
+                    logger.warning(f"Rate limited for {url}, waiting {rate_limit_delay}s")
+                    await asyncio.sleep(rate_limit_delay)
                 
             except httpx.TimeoutException:
                 logger.warning(f"Timeout for {url} (attempt {attempt + 1})")
@@ -138,6 +141,7 @@ class HTTPClient:
             
             if "text/html" in content_type or "application/xhtml" in content_type:
                 # HTML content
+                await response.aread()
                 content = response.text
                 encoding = response.encoding or "utf-8"
                 
@@ -152,6 +156,7 @@ class HTTPClient:
             
             elif "application/xml" in content_type or "text/xml" in content_type:
                 # XML content (sitemaps, RSS)
+                await response.aread()
                 return {
                     "status_code": response.status_code,
                     "content": response.text,
@@ -161,7 +166,7 @@ class HTTPClient:
                 }
             
             else:
-                # Non-HTML content
+                # Non-HTML content - the body is never downloaded
                 logger.debug(f"Non-HTML content type for {original_url}: {content_type}")
                 return {
                     "status_code": response.status_code,
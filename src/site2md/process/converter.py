@@ -1,12 +1,14 @@
 """Convert extracted content to high-quality Markdown."""
 
+import functools
+import hashlib
 import re
 from datetime import datetime
 from typing import Any, Dict, Optional
 from urllib.parse import urljoin, urlparse
 
 import markdownify
-import yaml
+from cachetools import LRUCache
 
 from ..utils.exceptions import ProcessingError
 from ..utils.logging import get_logger
@@ -14,6 +16,80 @@ from ..utils.validation import normalize_url, url_to_filepath
 
 logger = get_logger(__name__)
 
+# Converted bodies remembered per converter, keyed by content digest
+MARKDOWN_CACHE_SIZE = 1024
+
+# Distinct (page, href) pairs remembered by the link rewriter; the rewrite
+# depends only on its arguments, so one process-wide cache serves all crawls
+LINK_REWRITE_CACHE_SIZE = 65536
+
+# Strings YAML reads back unchanged without quoting
+_PLAIN_SCALAR = re.compile(r"[A-Za-z/][\w ./:?=&%+~@()'-]*")
+_YAML_KEYWORDS = frozenset({
+    "true", "false", "yes", "no", "on", "off", "y", "n", "null", "~",
+})
+
+# Characters that must be escaped in a double-quoted YAML scalar: quotes,
+# backslashes, line breaks (incl. NEL, LS, PS), the BOM and non-printables
+_YAML_NEEDS_ESCAPE = re.compile(
+    r'[^\x20\x21\x23-\x5b\x5d-\x7e\xa0-\u2027\u202a-\ud7ff'
+    r'\ue000-\ufefe\uff00-\ufffd\U00010000-\U0010ffff]'
+)
+_YAML_ESCAPES = {'"': '\\"', '\\': '\\\\', '\n': '\\n', '\t': '\\t', '\r': '\\r'}
+
+
+def _yaml_escape(match: "re.Match[str]") -> str:
+    """Escape one character for a double-quoted YAML scalar."""
+    char = match.group()
+    escaped = _YAML_ESCAPES.get(char)
+    if escaped is not None:
+        return escaped
+    code = ord(char)
+    if code <= 0xFF:
+        return f"\\x{code:02x}"
+    if code <= 0xFFFF:
+        return f"\\u{code:04x}"
+    return f"\\U{code:08x}"
+
+
+def _yaml_scalar(value: Any) -> str:
+    """Render a front matter value as a YAML scalar or flow sequence."""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, int):
+        return str(value)
+    if isinstance(value, datetime):
+        value = value.isoformat()
+    if isinstance(value, (list, tuple)):
+        return "[" + ", ".join(_yaml_scalar(item) for item in value) + "]"
+
+    value = str(value)
+    if (
+        _PLAIN_SCALAR.fullmatch(value)
+        and not value.endswith((" ", ":"))
+        and ": " not in value
+        and " #" not in value
+        and value.lower() not in _YAML_KEYWORDS
+    ):
+        return value
+    return '"' + _YAML_NEEDS_ESCAPE.sub(_yaml_escape, value) + '"'
+
+
+@functools.lru_cache(maxsize=LINK_REWRITE_CACHE_SIZE)
+def _rewrite_link_url(base_url: str, link_url: str) -> str:
+    """Resolve a link target: relative .md path if internal, absolute URL if not."""
+    # Convert relative to absolute
+    absolute_url = urljoin(base_url, link_url)
+    normalized_url = normalize_url(absolute_url)
+
+    # Check if it's an internal link
+    if urlparse(base_url).netloc == urlparse(normalized_url).netloc:
+        # Internal link - convert to relative .md path
+        return url_to_filepath(normalized_url, base_url, '.md')
+
+    # External link - keep absolute
+    return normalized_url
+
 
 class MarkdownConverter:
     """Converts HTML content to high-quality Markdown."""
@@ -28,6 +104,7 @@ class MarkdownConverter:
             strong_em_style=markdownify.ASTERISK,  # Use * for bold/italic
             strip=['script', 'style']  # Strip these tags only
         )
+        self._markdown_cache: LRUCache = LRUCache(maxsize=MARKDOWN_CACHE_SIZE)
 
     async def convert(
         self,
@@ -83,8 +160,8 @@ class MarkdownConverter:
     def _convert_html_to_markdown(self, html_content: str, base_url: str) -> str:
         """Convert HTML to Markdown with link rewriting."""
         try:
-            # First pass: convert to Markdown
-            markdown = self.md_converter.convert(html_content)
+            # First pass: convert to Markdown (shared templates repeat often)
+            markdown = self._markdownify(html_content)
 
             # Post-process: fix links
             markdown = self._rewrite_links(markdown, base_url)
@@ -102,6 +179,15 @@ class MarkdownConverter:
             # Fallback: return cleaned HTML
             return self._fallback_conversion(html_content)
 
+    def _markdownify(self, html_content: str) -> str:
+        """Run markdownify, reusing the result for content seen before."""
+        key = hashlib.blake2b(html_content.encode('utf-8'), digest_size=16).digest()
+        markdown = self._markdown_cache.get(key)
+        if markdown is None:
+            markdown = self.md_converter.convert(html_content)
+            self._markdown_cache[key] = markdown
+        return markdown
+
     def _rewrite_links(self, markdown: str, base_url: str) -> str:
         """Rewrite links in Markdown to use relative paths for internal links."""
         def replace_link(match):
@@ -109,23 +195,8 @@ class MarkdownConverter:
             link_url = match.group(2)
 
             try:
-                # Convert relative to absolute
-                absolute_url = urljoin(base_url, link_url)
-                normalized_url = normalize_url(absolute_url)
-
-                # Check if it's an internal link
-                base_domain = urlparse(base_url).netloc
-                link_domain = urlparse(normalized_url).netloc
-
-                if base_domain == link_domain:
-                    # Internal link - convert to relative .md path
-                    relative_path = url_to_filepath(
-                        normalized_url, base_url, '.md')
-                    return f"[{link_text}]({relative_path})"
-                else:
-                    # External link - keep absolute
-                    return f"[{link_text}]({normalized_url})"
-
+                # Navigation repeats on every page, so the rewrite is memoized
+                return f"[{link_text}]({_rewrite_link_url(base_url, link_url)})"
             except Exception as e:
                 logger.debug(f"Failed to rewrite link {link_url}: {e}")
                 return match.group(0)  # Return original
@@ -212,17 +283,9 @@ class MarkdownConverter:
         # Add empty tags array for user customization
         front_matter_data["tags"] = []
 
-        try:
-            yaml_content = yaml.dump(
-                front_matter_data,
-                default_flow_style=False,
-                allow_unicode=True,
-                sort_keys=False
-            )
-            return f"---\n{yaml_content.strip()}\n---"
-        except Exception as e:
-            logger.warning(f"Failed to generate YAML front matter: {e}")
-            return ""
+        # The schema is fixed and flat, so skip a general YAML emitter
+        lines = [f"{key}: {_yaml_scalar(value)}" for key, value in front_matter_data.items()]
+        return "---\n" + "\n".join(lines) + "\n---"
 
     def _generate_toc(self, markdown_content: str) -> str:
         """Generate table of contents from headings."""
@@ -1,15 +1,35 @@
 """Content extraction from HTML using trafilatura."""
 
 from typing import Any, Dict, Optional
+from urllib.parse import urljoin
 
 import trafilatura
-from bs4 import BeautifulSoup
+from lxml import etree
+from lxml.html import HtmlElement
+from trafilatura.utils import load_html
 
 from ..utils.exceptions import ProcessingError
 from ..utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Lookups run on every page, so compile them once
+_FIRST_TITLE = etree.XPath('(//title)[1]')
+_FIRST_H1 = etree.XPath('(//h1)[1]')
+_FIRST_P = etree.XPath('(//p)[1]')
+_HTML_LANG = etree.XPath('/html/@lang')
+_LINKS_WITH_REL = etree.XPath('//link[@rel]')
+_FIRST_META = {
+    (attr, value): etree.XPath(f'(//meta[@{attr}="{value}"])[1]')
+    for attr, value in (
+        ('property', 'og:title'),
+        ('property', 'og:description'),
+        ('name', 'description'),
+        ('name', 'language'),
+        ('http-equiv', 'content-language'),
+    )
+}
+
 
 class ContentExtractor:
     """Extracts main content from HTML using trafilatura."""
@@ -20,40 +40,40 @@ class ContentExtractor:
     async def extract(self, html_content: str, url: str) -> Dict[str, Any]:
         """Extract main content and metadata from HTML."""
         try:
-            # Use trafilatura for main content extraction
-            extracted_content = trafilatura.extract(
-                html_content,
-                favor_precision=True,
-                include_comments=False,
-                include_tables=True,
-                include_formatting=True,
-                include_links=True,
-                url=url,
-            )
+            # Parse once with lxml; trafilatura accepts the tree directly
+            tree = load_html(html_content)
+            if tree is None:
+                extracted_content = ""
+                metadata = None
+                title = "Untitled"
+                description = ""
+                canonical_url = None
+                language = None
+            else:
+                # Extract metadata
+                metadata = trafilatura.extract_metadata(tree)
+
+                # Read page-level fields before trafilatura prunes the tree
+                title = self._extract_title(tree, metadata)
+                description = self._extract_description(tree, metadata)
+                canonical_url = self._extract_canonical(tree, url)
+                language = self._extract_language(tree, metadata)
+
+                # Use trafilatura for main content extraction
+                extracted_content = trafilatura.extract(
+                    tree,
+                    favor_precision=True,
+                    include_comments=False,
+                    include_tables=True,
+                    include_formatting=True,
+                    include_links=True,
+                    url=url,
+                )
 
             if not extracted_content:
                 logger.warning(f"No content extracted from {url}")
                 extracted_content = ""
 
-            # Extract metadata
-            metadata = trafilatura.extract_metadata(html_content)
-
-            # Parse HTML for additional elements we need
-            from bs4 import BeautifulSoup
-            soup = BeautifulSoup(html_content, 'html.parser')
-
-            # Extract title
-            title = self._extract_title(soup, metadata)
-
-            # Extract description
-            description = self._extract_description(soup, metadata)
-
-            # Extract canonical URL
-            canonical_url = self._extract_canonical(soup, url)
-
-            # Extract language
-            language = self._extract_language(soup, metadata)
-
             return {
                 "content": extracted_content,
                 "title": title,
@@ -69,78 +89,82 @@ class ContentExtractor:
             raise ProcessingError(
                 f"Failed to extract content from {url}: {e}") from e
 
-    def _extract_title(self, soup: BeautifulSoup, metadata: Optional[Any]) -> str:
+    def _extract_title(self, tree: HtmlElement, metadata: Optional[Any]) -> str:
         """Extract page title."""
         # Try metadata first
         if metadata and hasattr(metadata, 'title') and metadata.title:
             return metadata.title.strip()
 
         # Try HTML title tag
-        title_tag = soup.find('title')
-        if title_tag and title_tag.string:
-            return title_tag.string.strip()
+        for title_tag in _FIRST_TITLE(tree):
+            if title_tag.text_content().strip():
+                return title_tag.text_content().strip()
 
         # Try first h1 tag
-        h1_tag = soup.find('h1')
-        if h1_tag:
-            return h1_tag.get_text().strip()
+        for h1_tag in _FIRST_H1(tree):
+            return h1_tag.text_content().strip()
 
         # Try og:title meta tag
-        og_title = soup.find('meta', property='og:title')
-        if og_title and og_title.get('content'):
-            return og_title['content'].strip()
+        og_title = _meta_content(tree, 'property', 'og:title')
+        if og_title:
+            return og_title.strip()
 
         return "Untitled"
 
-    def _extract_description(self, soup: BeautifulSoup, metadata: Optional[Any]) -> str:
+    def _extract_description(self, tree: HtmlElement, metadata: Optional[Any]) -> str:
         """Extract page description."""
         # Try metadata first
         if metadata and hasattr(metadata, 'description') and metadata.description:
             return metadata.description.strip()
 
         # Try meta description
-        desc_tag = soup.find('meta', attrs={'name': 'description'})
-        if desc_tag and desc_tag.get('content'):
-            return desc_tag['content'].strip()
+        desc = _meta_content(tree, 'name', 'description')
+        if desc:
+            return desc.strip()
 
         # Try og:description
-        og_desc = soup.find('meta', property='og:description')
-        if og_desc and og_desc.get('content'):
-            return og_desc['content'].strip()
+        og_desc = _meta_content(tree, 'property', 'og:description')
+        if og_desc:
+            return og_desc.strip()
 
         # Try first paragraph
-        first_p = soup.find('p')
-        if first_p:
-            text = first_p.get_text().strip()
+        for first_p in _FIRST_P(tree):
+            text = first_p.text_content().strip()
             if len(text) > 20:  # Must be substantial
                 return text[:200] + ('...' if len(text) > 200 else '')
 
         return ""
 
-    def _extract_canonical(self, soup: BeautifulSoup, current_url: str) -> Optional[str]:
+    def _extract_canonical(self, tree: HtmlElement, current_url: str) -> Optional[str]:
         """Extract canonical URL."""
-        canonical_tag = soup.find('link', rel='canonical')
-        if canonical_tag and canonical_tag.get('href'):
-            from urllib.parse import urljoin
-            return urljoin(current_url, canonical_tag['href'])
+        for link in _LINKS_WITH_REL(tree):
+            if 'canonical' in link.get('rel').split() and link.get('href'):
+                return urljoin(current_url, link.get('href'))
 
         return None
 
-    def _extract_language(self, soup: BeautifulSoup, metadata: Optional[Any]) -> Optional[str]:
+    def _extract_language(self, tree: HtmlElement, metadata: Optional[Any]) -> Optional[str]:
         """Extract page language."""
         # Try html lang attribute
-        html_tag = soup.find('html')
-        if html_tag and html_tag.get('lang'):
-            return html_tag['lang']
+        for lang in _HTML_LANG(tree):
+            if lang:
+                return str(lang)
 
         # Try meta language
-        lang_tag = soup.find('meta', attrs={'name': 'language'})
-        if lang_tag and lang_tag.get('content'):
-            return lang_tag['content']
+        lang = _meta_content(tree, 'name', 'language')
+        if lang:
+            return lang
 
         # Try http-equiv
-        lang_tag = soup.find('meta', {'http-equiv': 'content-language'})
-        if lang_tag and lang_tag.get('content'):
-            return lang_tag['content']
+        lang = _meta_content(tree, 'http-equiv', 'content-language')
+        if lang:
+            return lang
 
         return None
+
+
+def _meta_content(tree: HtmlElement, attr: str, value: str) -> Optional[str]:
+    """Return the content of the first <meta> whose attribute equals value."""
+    for meta in _FIRST_META[attr, value](tree):
+        return meta.get('content')
+    return None
@@ -1,5 +1,6 @@
 """File system management for Site2MD."""
 
+import asyncio
 import hashlib
 from pathlib import Path
 from typing import Any, Dict
@@ -38,9 +39,8 @@ class FileSystemManager:
             # Handle naming conflicts
             file_path = self._resolve_path_conflict(file_path)
             
-            # Write content
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(markdown_content)
+            # Encode once and write in a single call, off the event loop
+            await asyncio.to_thread(file_path.write_bytes, markdown_content.encode('utf-8'))
             
             logger.debug(f"Saved page: {url} -> {file_path}")
             return file_path
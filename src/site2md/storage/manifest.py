@@ -1,10 +1,11 @@
 """SQLite-based manifest for tracking crawl state and incremental updates."""
 
+import asyncio
 import hashlib
 import sqlite3
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, NamedTuple, Optional
 
 import aiosqlite
 
@@ -13,6 +14,38 @@ from ..utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Seconds between background commit + WAL checkpoint passes
+CHECKPOINT_INTERVAL = 30.0
+
+
+class PageRow(NamedTuple):
+    """A row from the pages table."""
+    
+    id: int
+    url: str
+    normalized_url: str
+    canonical_url: Optional[str]
+    title: Optional[str]
+    content_hash: Optional[int]
+    etag: Optional[str]
+    last_modified: Optional[str]
+    fetch_timestamp: str
+    file_path: Optional[str]
+    status: str
+    error_message: Optional[str]
+    created_at: str
+    updated_at: str
+
+
+_PAGE_COLUMNS = ", ".join(PageRow._fields)
+
+
+def content_digest(content: str) -> int:
+    """Stable signed 64-bit digest of page content for the content_hash column."""
+    # hash() is salted per process, so its values never match across runs
+    digest = hashlib.blake2b(content.encode('utf-8'), digest_size=8).digest()
+    return int.from_bytes(digest, 'big', signed=True)
+
 
 class CrawlManifest:
     """Manages crawl state using SQLite database."""
@@ -21,9 +54,13 @@ class CrawlManifest:
         self.output_dir = Path(output_dir)
         self.db_path = self.output_dir / ".site2md_manifest.db"
         self.db: Optional[aiosqlite.Connection] = None
+        self._checkpoint_task: Optional[asyncio.Task] = None
     
     async def initialize(self) -> None:
         """Initialize the manifest database."""
+        if self.db is not None:
+            return
+        
         try:
             self.output_dir.mkdir(parents=True, exist_ok=True)
             
@@ -34,9 +71,14 @@ class CrawlManifest:
             await self.db.execute("PRAGMA synchronous=NORMAL")
             await self.db.execute("PRAGMA cache_size=10000")
             
+            # Checkpoints run in the background task instead of on commit
+            await self.db.execute("PRAGMA wal_autocheckpoint=0")
+            
             # Create tables
             await self._create_tables()
             
+            self._checkpoint_task = asyncio.create_task(self._periodic_checkpoint())
+            
             logger.debug(f"Initialized manifest database: {self.db_path}")
             
         except Exception as e:
@@ -44,11 +86,41 @@ class CrawlManifest:
             raise StorageError(f"Failed to initialize manifest: {e}") from e
     
     async def close(self) -> None:
-        """Close the database connection."""
+        """Flush pending writes and close the database connection."""
+        if self._checkpoint_task:
+            self._checkpoint_task.cancel()
+            try:
+                await self._checkpoint_task
+            except asyncio.CancelledError:
+                pass
+            self._checkpoint_task = None
+        
         if self.db:
+            await self.flush()
             await self.db.close()
             self.db = None
     
+    async def flush(self) -> None:
+        """Commit the pending manifest transaction, if any."""
+        if self.db and self.db.in_transaction:
+            await self.db.commit()
+    
+    async def _periodic_checkpoint(self) -> None:
+        """Commit pending writes and checkpoint the WAL on a fixed interval."""
+        while True:
+            await asyncio.sleep(CHECKPOINT_INTERVAL)
+            try:
+                await self.flush()
+                
+                # Checkpoint on a separate connection to keep it off the write path
+                async with aiosqlite.connect(self.db_path) as conn:
+                    await conn.execute("PRAGMA wal_checkpoint(PASSIVE)")
+                
+                logger.debug("Checkpointed manifest WAL")
+                
+            except Exception as e:
+                logger.warning(f"Manifest checkpoint failed: {e}")
+    
     async def _create_tables(self) -> None:
         """Create database tables."""
         # Pages table
@@ -59,7 +131,7 @@ class CrawlManifest:
                 normalized_url TEXT NOT NULL,
                 canonical_url TEXT,
                 title TEXT,
-                content_hash TEXT,
+                content_hash INTEGER,
                 etag TEXT,
                 last_modified TEXT,
                 fetch_timestamp TEXT NOT NULL,
@@ -77,7 +149,7 @@ class CrawlManifest:
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 url TEXT UNIQUE NOT NULL,
                 file_path TEXT NOT NULL,
-                content_hash TEXT,
+                content_hash INTEGER,
                 size_bytes INTEGER,
                 content_type TEXT,
                 fetch_timestamp TEXT NOT NULL,
@@ -123,7 +195,6 @@ class CrawlManifest:
     ) -> None:
         """Update page information in manifest."""
         try:
-            content_hash_str = str(content_hash) if content_hash else None
             fetch_timestamp = datetime.now().isoformat()
             
             await self.db.execute("""
@@ -137,7 +208,7 @@ class CrawlManifest:
                 url,  # normalized_url (same for now)
                 canonical_url,
                 title,
-                content_hash_str,
+                content_hash,
                 etag,
                 last_modified,
                 fetch_timestamp,
@@ -147,8 +218,6 @@ class CrawlManifest:
                 datetime.now().isoformat()
             ))
             
-            await self.db.commit()
-            
             logger.debug(f"Updated page manifest: {url}")
             
         except Exception as e:
@@ -159,7 +228,7 @@ class CrawlManifest:
         self,
         url: str,
         filepath: Path,
-        content_hash: str,
+        content_hash: int,
         size_bytes: int,
         content_type: str = ""
     ) -> None:
@@ -173,8 +242,6 @@ class CrawlManifest:
                 ) VALUES (?, ?, ?, ?, ?, ?)
             """, (url, str(filepath), content_hash, size_bytes, content_type, fetch_timestamp))
             
-            await self.db.commit()
-            
             logger.debug(f"Updated asset manifest: {url}")
             
         except Exception as e:
@@ -214,7 +281,7 @@ class CrawlManifest:
             
             # Check content hash if available
             if content_hash and db_content_hash:
-                return str(content_hash) == db_content_hash
+                return content_hash == db_content_hash
             
             # If no comparison method available, consider stale
             return False
@@ -223,19 +290,18 @@ class CrawlManifest:
             logger.debug(f"Error checking if {url} is up to date: {e}")
             return False  # On error, re-crawl to be safe
     
-    async def get_page_info(self, url: str) -> Optional[Dict[str, Any]]:
+    async def get_page_info(self, url: str) -> Optional[PageRow]:
         """Get page information from manifest."""
         try:
-            cursor = await self.db.execute("""
-                SELECT * FROM pages WHERE url = ? OR normalized_url = ?
+            cursor = await self.db.execute(f"""
+                SELECT {_PAGE_COLUMNS} FROM pages WHERE url = ? OR normalized_url = ?
             """, (url, url))
             
             row = await cursor.fetchone()
             if not row:
                 return None
             
-            columns = [desc[0] for desc in cursor.description]
-            return dict(zip(columns, row))
+            return PageRow._make(row)
             
         except Exception as e:
             logger.debug(f"Error getting page info for {url}: {e}")
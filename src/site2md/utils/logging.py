@@ -3,15 +3,24 @@
 import json
 import logging
 import sys
+import time
+from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 from rich.console import Console
 from rich.logging import RichHandler
 
-_loggers: Dict[str, logging.Logger] = {}
 _console = Console(stderr=True)
 
+# Standard LogRecord attributes excluded from JSON extra fields
+_LOGRECORD_STD_ATTRS = frozenset({
+    "name", "msg", "args", "levelname", "levelno", "pathname",
+    "filename", "module", "lineno", "funcName", "created", "msecs",
+    "relativeCreated", "thread", "threadName", "processName",
+    "process", "getMessage", "exc_info", "exc_text", "stack_info",
+})
+
 
 def setup_logging(
     verbose: bool = False,
@@ -78,14 +87,32 @@ def setup_logging(
 
 def get_logger(name: str) -> logging.Logger:
     """Get or create a logger instance."""
-    if name not in _loggers:
-        _loggers[name] = logging.getLogger(name)
-    return _loggers[name]
+    # logging.getLogger already memoizes loggers by name
+    return logging.getLogger(name)
 
 
 class JSONFormatter(logging.Formatter):
     """JSON log formatter for structured logging."""
     
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        # (second, stamp) swapped as one tuple so threads never see a torn pair
+        self._cached_time: Tuple[Optional[int], str] = (None, "")
+    
+    def formatTime(self, record: logging.LogRecord, datefmt: Optional[str] = None) -> str:
+        """Format record time, reusing the strftime result within one second."""
+        if datefmt:
+            return super().formatTime(record, datefmt)
+        
+        second = int(record.created)
+        cached_second, stamp = self._cached_time
+        if second != cached_second:
+            stamp = time.strftime(
+                self.default_time_format, self.converter(record.created)
+            )
+            self._cached_time = (second, stamp)
+        return self.default_msec_format % (stamp, record.msecs)
+    
     def format(self, record: logging.LogRecord) -> str:
         """Format log record as JSON."""
         log_data = {
@@ -101,59 +128,66 @@ class JSONFormatter(logging.Formatter):
         
         # Add extra fields
         for key, value in record.__dict__.items():
-            if key not in [
-                "name", "msg", "args", "levelname", "levelno", "pathname",
-                "filename", "module", "lineno", "funcName", "created", "msecs",
-                "relativeCreated", "thread", "threadName", "processName",
-                "process", "getMessage", "exc_info", "exc_text", "stack_info"
-            ]:
+            if key not in _LOGRECORD_STD_ATTRS:
                 log_data[key] = value
         
         return json.dumps(log_data, default=str, ensure_ascii=False)
 
 
+# Counter slots used by CrawlStatsLogger
+_PAGES_CRAWLED, _PAGES_CACHED, _PAGES_FAILED, _ASSETS_DOWNLOADED, _TOTAL_BYTES = range(5)
+_COUNTER_NAMES = (
+    "pages_crawled",
+    "pages_cached",
+    "pages_failed",
+    "assets_downloaded",
+    "total_bytes",
+)
+
+
 class CrawlStatsLogger:
     """Logger for crawl statistics and progress."""
     
     def __init__(self, logger: logging.Logger):
         self.logger = logger
-        self.stats = {
-            "pages_crawled": 0,
-            "pages_cached": 0,
-            "pages_failed": 0,
-            "assets_downloaded": 0,
-            "total_bytes": 0,
-            "start_time": None,
-            "end_time": None,
-        }
+        self._counts = [0] * len(_COUNTER_NAMES)
+        self.start_time: Optional[datetime] = None
+        self.end_time: Optional[datetime] = None
     
     def log_page_crawled(self, url: str, bytes_count: int = 0) -> None:
         """Log a successfully crawled page."""
-        self.stats["pages_crawled"] += 1
-        self.stats["total_bytes"] += bytes_count
-        self.logger.debug(f"Crawled: {url} ({bytes_count} bytes)")
+        counts = self._counts
+        counts[_PAGES_CRAWLED] += 1
+        counts[_TOTAL_BYTES] += bytes_count
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"Crawled: {url} ({bytes_count} bytes)")
     
     def log_page_cached(self, url: str) -> None:
         """Log a cached page (skipped)."""
-        self.stats["pages_cached"] += 1
-        self.logger.debug(f"Cached: {url}")
+        self._counts[_PAGES_CACHED] += 1
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"Cached: {url}")
     
     def log_page_failed(self, url: str, error: str) -> None:
         """Log a failed page."""
-        self.stats["pages_failed"] += 1
+        self._counts[_PAGES_FAILED] += 1
         self.logger.warning(f"Failed: {url} - {error}")
     
     def log_asset_downloaded(self, url: str, bytes_count: int = 0) -> None:
         """Log a downloaded asset."""
-        self.stats["assets_downloaded"] += 1
-        self.stats["total_bytes"] += bytes_count
-        self.logger.debug(f"Downloaded asset: {url} ({bytes_count} bytes)")
+        counts = self._counts
+        counts[_ASSETS_DOWNLOADED] += 1
+        counts[_TOTAL_BYTES] += bytes_count
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"Downloaded asset: {url} ({bytes_count} bytes)")
     
     def get_stats(self) -> Dict[str, Any]:
         """Get current statistics."""
-        stats = self.stats.copy()
-        if self.stats["start_time"] and self.stats["end_time"]:
+        stats: Dict[str, Any] = dict(zip(_COUNTER_NAMES, self._counts))
+        stats["start_time"] = self.start_time
+        stats["end_time"] = self.end_time
+        if self.start_time and self.end_time:
             stats["duration_seconds"] = (
-                self.stats["end_time"] - self.stats["start_time"]
+                self.end_time - self.start_time
             ).total_seconds()
-        return stats
\ No newline at end of file
+        return stats
@@ -1,16 +1,78 @@
 """URL and content validation utilities for Site2MD."""
 
+import functools
 import re
-from typing import Optional, Tuple
-from urllib.parse import urljoin, urlparse, urlunparse
+from typing import Callable, Iterable, List, Optional, Sequence, Tuple, Union
+from urllib.parse import urljoin, urlsplit, urlunsplit
 
-import tldextract
 from tldextract import TLDExtract
 
 from .exceptions import ValidationError
 
-# Initialize TLD extractor with cache
-tld_extract = TLDExtract(cache_dir=None)
+# One process-wide TLD extractor. It uses the Public Suffix List snapshot bundled
+# with tldextract, so no process (CLI, web worker, pool worker) fetches the list
+# over the network or writes a disk cache before its first lookup.
+tld_extract = TLDExtract(cache_dir=None, suffix_list_urls=())
+
+# Translation table mapping filesystem-invalid characters to underscores
+_FN_TABLE = str.maketrans(
+    {c: '_' for c in '<>:"/\\|?*' + ''.join(chr(i) for i in range(32))}
+)
+_UNDERSCORE_RUN_RE = re.compile(r'__+')
+
+# Obvious binary files; .css and .js are usually not main content either
+_BINARY_EXTENSIONS = frozenset({
+    '.jpg', '.jpeg', '.png', '.gif', '.webp', '.svg', '.ico',
+    '.pdf', '.doc', '.docx', '.xls', '.xlsx', '.ppt', '.pptx',
+    '.zip', '.tar', '.gz', '.rar', '.7z',
+    '.mp3', '.mp4', '.avi', '.mov', '.wmv', '.flv',
+    '.exe', '.dmg', '.deb', '.rpm',
+    '.css', '.js',
+})
+
+# Hostnames whose public-suffix split is remembered
+DOMAIN_CACHE_SIZE = 4096
+
+# Sanitized URL path segments; sites reuse the same directory names
+SEGMENT_CACHE_SIZE = 4096
+
+# Distinct include/exclude pattern lists kept compiled
+PATTERN_CACHE_SIZE = 256
+
+# Plain http(s) URLs: no userinfo, IPv6 hosts or tabs/newlines. Anything
+# else goes through urlsplit in normalize_url.
+_SIMPLE_URL_RE = re.compile(
+    r'(?i:(https?))://([A-Za-z0-9.-]+)(?::(\d{1,5}))?'
+    r'(/[^?#\t\r\n]*)?(?:\?([^#\t\r\n]*))?(?:#.*)?',
+    re.DOTALL,
+)
+_DEFAULT_PORTS = {'http': 80, 'https': 443}
+
+# Canonical link tag matcher
+_CANONICAL_RE = re.compile(
+    r'<link[^>]+rel=["\']canonical["\'][^>]+href=["\']([^"\']+)["\']',
+    re.IGNORECASE,
+)
+
+
+def _normalize_simple_url(url: str) -> Optional[str]:
+    """One-regex normalize_url for plain URLs; None if the URL needs urlsplit."""
+    match = _SIMPLE_URL_RE.fullmatch(url)
+    if match is None:
+        return None
+    
+    scheme, host, port, path, query = match.groups()
+    scheme = scheme.lower()
+    netloc = host.lower()
+    if port:
+        port_number = int(port)
+        if port_number > 65535:
+            return None  # Let urlsplit report it
+        if port_number and port_number != _DEFAULT_PORTS[scheme]:
+            netloc += f":{port_number}"
+    
+    normalized = f"{scheme}://{netloc}{path or '/'}"
+    return f"{normalized}?{query}" if query else normalized
 
 
 def normalize_url(url: str, base_url: Optional[str] = None) -> str:
@@ -20,7 +82,11 @@ def normalize_url(url: str, base_url: Optional[str] = None) -> str:
         if base_url:
             url = urljoin(base_url, url)
         
-        parsed = urlparse(url)
+        normalized = _normalize_simple_url(url)
+        if normalized is not None:
+            return normalized
+        
+        parsed = urlsplit(url)
         
         # Ensure scheme is present
         if not parsed.scheme:
@@ -65,23 +131,24 @@ def normalize_url(url: str, base_url: Optional[str] = None) -> str:
         query = parsed.query
         
         # Reconstruct URL
-        normalized = urlunparse((scheme, netloc, path, parsed.params, query, fragment))
+        normalized = urlunsplit((scheme, netloc, path, query, fragment))
         return normalized
         
     except Exception as e:
         raise ValidationError(f"Invalid URL '{url}': {e}") from e
 
 
-def get_domain_info(url: str) -> Tuple[str, str, str]:
-    """Extract domain information from URL."""
+@functools.lru_cache(maxsize=DOMAIN_CACHE_SIZE)
+def _domain_info(host: str) -> Tuple[str, str, str]:
+    """Split a hostname into (full, registrable, subdomain); cached per host."""
     try:
-        result = tld_extract(url)
+        result = tld_extract(host)
         domain = result.domain
         suffix = result.suffix
         subdomain = result.subdomain
         
         if not domain or not suffix:
-            raise ValidationError(f"Invalid domain in URL: {url}")
+            raise ValidationError(f"Invalid domain in URL: {host}")
         
         registrable_domain = f"{domain}.{suffix}"
         full_domain = f"{subdomain}.{registrable_domain}" if subdomain else registrable_domain
@@ -89,98 +156,259 @@ def get_domain_info(url: str) -> Tuple[str, str, str]:
         return full_domain, registrable_domain, subdomain
         
     except Exception as e:
-        raise ValidationError(f"Error extracting domain from '{url}': {e}") from e
+        raise ValidationError(f"Error extracting domain from '{host}': {e}") from e
 
 
-def is_same_domain(url1: str, url2: str, allow_subdomains: bool = False) -> bool:
-    """Check if two URLs belong to the same domain."""
+def _url_host(url: str) -> str:
+    """Hostname of a URL, or the URL itself when it has none (e.g. no scheme)."""
     try:
-        _, reg_domain1, subdomain1 = get_domain_info(url1)
-        _, reg_domain2, subdomain2 = get_domain_info(url2)
-        
-        if allow_subdomains:
-            return reg_domain1 == reg_domain2
-        else:
-            full1 = f"{subdomain1}.{reg_domain1}" if subdomain1 else reg_domain1
-            full2 = f"{subdomain2}.{reg_domain2}" if subdomain2 else reg_domain2
-            return full1 == full2
-            
+        return urlsplit(url).hostname or url
+    except ValueError:
+        return url
+
+
+def get_domain_info(url: str) -> Tuple[str, str, str]:
+    """Extract domain information from URL."""
+    return _domain_info(_url_host(url))
+
+
+def _same_domain(host1: str, host2: str, allow_subdomains: bool) -> bool:
+    """Compare two hostnames by full or registrable domain."""
+    try:
+        full1, reg_domain1, _ = _domain_info(host1)
+        full2, reg_domain2, _ = _domain_info(host2)
     except ValidationError:
         return False
+    
+    if allow_subdomains:
+        return reg_domain1 == reg_domain2
+    return full1 == full2
+
+
+def is_same_domain(url1: str, url2: str, allow_subdomains: bool = False) -> bool:
+    """Check if two URLs belong to the same domain."""
+    return _same_domain(_url_host(url1), _url_host(url2), allow_subdomains)
+
+
+def _strip_params(path: str) -> str:
+    """Drop ;params from the last path segment, as urlparse would."""
+    index = path.find(';', max(path.rfind('/'), 0))
+    return path if index < 0 else path[:index]
+
+
+def _is_content_path(path: str) -> bool:
+    """Check a URL path against known binary file extensions."""
+    # One set lookup on the last segment's extension
+    _, dot, extension = _strip_params(path).rpartition('/')[2].rpartition('.')
+    return not dot or '.' + extension.lower() not in _BINARY_EXTENSIONS
 
 
 def is_valid_content_url(url: str) -> bool:
     """Check if URL points to valid content (not binary files)."""
-    parsed = urlparse(url)
-    path = parsed.path.lower()
-    
-    # Skip obvious binary files
-    binary_extensions = {
-        '.jpg', '.jpeg', '.png', '.gif', '.webp', '.svg', '.ico',
-        '.pdf', '.doc', '.docx', '.xls', '.xlsx', '.ppt', '.pptx',
-        '.zip', '.tar', '.gz', '.rar', '.7z',
-        '.mp3', '.mp4', '.avi', '.mov', '.wmv', '.flv',
-        '.exe', '.dmg', '.deb', '.rpm',
-        '.css', '.js'  # Usually not main content
-    }
-    
-    for ext in binary_extensions:
-        if path.endswith(ext):
-            return False
+    return _is_content_path(urlsplit(url).path)
+
+
+@functools.lru_cache(maxsize=PATTERN_CACHE_SIZE)
+def _compile_patterns(patterns: Tuple[Union[str, re.Pattern], ...]) -> Tuple[re.Pattern, ...]:
+    """Compile scope patterns into one case-insensitive alternation, skipping invalid ones."""
+    sources = []
+    compiled = []
+    for pattern in patterns:
+        if isinstance(pattern, re.Pattern):
+            compiled.append(pattern)
+            continue
+        try:
+            regex = re.compile(pattern, re.IGNORECASE)
+        except re.error:
+            continue  # Skip invalid patterns
+        if regex.groups:
+            # Joining would renumber its groups and break backreferences
+            compiled.append(regex)
+        else:
+            sources.append(pattern)
     
-    return True
+    if sources:
+        try:
+            compiled.insert(0, re.compile('|'.join(f'(?:{p})' for p in sources), re.IGNORECASE))
+        except re.error:
+            # e.g. inline global flags, which are only valid at the very start
+            compiled[:0] = [re.compile(p, re.IGNORECASE) for p in sources]
+    
+    return tuple(compiled)
 
 
-def matches_pattern(url: str, patterns: list, is_include: bool = True) -> bool:
+def _compile_re2_matcher(patterns: Tuple[Union[str, re.Pattern], ...]) -> Optional[Callable[[str], bool]]:
+    """Build an RE2 (linear-time DFA) matcher, or None if RE2 can't take these patterns."""
+    if not all(isinstance(pattern, str) for pattern in patterns):
+        return None
+    try:
+        import re2
+    except ImportError:
+        return None
+    
+    try:
+        options = re2.Options()
+        options.case_sensitive = False
+        regex = re2.compile('|'.join(f'(?:{p})' for p in patterns), options)
+    except Exception:
+        # Backreferences, lookarounds or invalid patterns: use the re path
+        return None
+    
+    return lambda url: regex.search(url) is not None
+
+
+@functools.lru_cache(maxsize=PATTERN_CACHE_SIZE)
+def _url_matcher(patterns: Tuple[Union[str, re.Pattern], ...]) -> Callable[[str], bool]:
+    """Cached compile_url_matcher body, keyed by the pattern tuple."""
+    matcher = _compile_re2_matcher(patterns)
+    if matcher is not None:
+        return matcher
+    
+    regexes = _compile_patterns(patterns)
+    return lambda url: any(regex.search(url) for regex in regexes)
+
+
+def compile_url_matcher(patterns: Sequence[Union[str, re.Pattern]]) -> Callable[[str], bool]:
+    """Return a predicate telling whether a URL matches any of the patterns."""
+    return _url_matcher(tuple(patterns))
+
+
+def matches_pattern(
+    url: str,
+    patterns: Sequence[Union[str, re.Pattern]],
+    is_include: bool = True
+) -> bool:
     """Check if URL matches any of the given regex patterns."""
     if not patterns:
         return is_include  # Default behavior when no patterns
     
+    return compile_url_matcher(patterns)(url)
+
+
+def _valid_sources(patterns: Tuple[Union[str, re.Pattern], ...]) -> Optional[List[str]]:
+    """String patterns that compile, or None if any is precompiled or has groups."""
+    sources = []
     for pattern in patterns:
+        if isinstance(pattern, re.Pattern):
+            return None
         try:
-            if re.search(pattern, url, re.IGNORECASE):
-                return True
+            regex = re.compile(pattern, re.IGNORECASE)
         except re.error:
             continue  # Skip invalid patterns
+        if regex.groups:
+            return None  # Joining would renumber groups and break backreferences
+        sources.append(pattern)
+    return sources
+
+
+@functools.lru_cache(maxsize=PATTERN_CACHE_SIZE)
+def _compile_scope(
+    include: Tuple[Union[str, re.Pattern], ...],
+    exclude: Tuple[Union[str, re.Pattern], ...],
+) -> Optional[Callable[[str], bool]]:
+    """Predicate for the include/exclude rules, or None when there are none."""
+    if not include and not exclude:
+        return None
+    if not include:
+        exclude_matcher = _url_matcher(exclude)
+        return lambda url: not exclude_matcher(url)
+    if not exclude:
+        return _url_matcher(include)
     
-    return False
+    # Both lists: keep RE2's linear-time matchers when it accepts them
+    include_re2 = _compile_re2_matcher(include)
+    exclude_re2 = _compile_re2_matcher(exclude)
+    if include_re2 is not None and exclude_re2 is not None:
+        return lambda url: not exclude_re2(url) and include_re2(url)
+    
+    # Otherwise one anchored pass: no exclude anywhere, some include somewhere
+    include_sources = _valid_sources(include)
+    exclude_sources = _valid_sources(exclude)
+    if include_sources is not None and exclude_sources is not None:
+        include_alt = '|'.join(f'(?:{p})' for p in include_sources) or '(?!)'
+        exclude_alt = '|'.join(f'(?:{p})' for p in exclude_sources) or '(?!)'
+        try:
+            regex = re.compile(
+                rf'\A(?![\s\S]*?(?:{exclude_alt}))(?=[\s\S]*?(?:{include_alt}))',
+                re.IGNORECASE,
+            )
+        except re.error:
+            pass  # e.g. inline global flags; fall back to separate matchers
+        else:
+            return lambda url: regex.match(url) is not None
+    
+    include_matcher = _url_matcher(include)
+    exclude_matcher = _url_matcher(exclude)
+    return lambda url: not exclude_matcher(url) and include_matcher(url)
 
 
-def should_crawl_url(
-    url: str, 
-    base_url: str, 
-    allow_subdomains: bool = False,
-    include_patterns: Optional[list] = None,
-    exclude_patterns: Optional[list] = None
+def _url_in_scope(
+    url: str,
+    base_host: str,
+    allow_subdomains: bool,
+    patterns: Optional[Callable[[str], bool]],
 ) -> bool:
-    """Determine if URL should be crawled based on scope rules."""
-    # Must be same domain
-    if not is_same_domain(url, base_url, allow_subdomains):
+    """Scope check for one URL against prepared base host and pattern predicate."""
+    # Parse once; the domain and extension checks share the result
+    try:
+        parsed = urlsplit(url)
+        host = parsed.hostname or url
+    except ValueError:
         return False
     
-    # Must be valid content
-    if not is_valid_content_url(url):
+    # Must be same domain
+    if not _same_domain(host, base_host, allow_subdomains):
         return False
     
-    # Check exclude patterns first
-    if exclude_patterns and matches_pattern(url, exclude_patterns):
+    # Must be valid content
+    if not _is_content_path(parsed.path):
         return False
     
-    # Check include patterns
-    if include_patterns and not matches_pattern(url, include_patterns):
+    # Exclude patterns win over include patterns
+    if patterns and not patterns(url):
         return False
     
     return True
 
 
+def should_crawl_url(
+    url: str, 
+    base_url: str, 
+    allow_subdomains: bool = False,
+    include_patterns: Optional[list] = None,
+    exclude_patterns: Optional[list] = None
+) -> bool:
+    """Determine if URL should be crawled based on scope rules."""
+    return should_crawl_urls(
+        (url,), base_url, allow_subdomains, include_patterns, exclude_patterns
+    )[0]
+
+
+def should_crawl_urls(
+    urls: Iterable[str],
+    base_url: str,
+    allow_subdomains: bool = False,
+    include_patterns: Optional[list] = None,
+    exclude_patterns: Optional[list] = None
+) -> List[bool]:
+    """Batch form of should_crawl_url; scope rules are prepared once per batch."""
+    base_host = _url_host(base_url)
+    patterns = _compile_scope(tuple(include_patterns or ()), tuple(exclude_patterns or ()))
+    
+    return [
+        _url_in_scope(url, base_host, allow_subdomains, patterns)
+        for url in urls
+    ]
+
+
 def sanitize_filename(filename: str, max_length: int = 255) -> str:
     """Sanitize filename for filesystem compatibility."""
-    # Remove/replace invalid characters
-    invalid_chars = r'<>:"/\\|?*\x00-\x1f'
-    sanitized = re.sub(f'[{re.escape(invalid_chars)}]', '_', filename)
+    # Replace invalid characters
+    sanitized = filename.translate(_FN_TABLE)
     
     # Replace multiple underscores with single
-    sanitized = re.sub(r'_+', '_', sanitized)
+    if '__' in sanitized:
+        sanitized = _UNDERSCORE_RUN_RE.sub('_', sanitized)
     
     # Trim and ensure not empty
     sanitized = sanitized.strip('._')
@@ -201,25 +429,28 @@ def sanitize_filename(filename: str, max_length: int = 255) -> str:
     return sanitized
 
 
+@functools.lru_cache(maxsize=SEGMENT_CACHE_SIZE)
+def _sanitize_segment(segment: str) -> str:
+    """sanitize_filename for one URL path segment, cached."""
+    return sanitize_filename(segment)
+
+
 def url_to_filepath(url: str, base_url: str, extension: str = '.md') -> str:
     """Convert URL to relative filepath."""
-    parsed_base = urlparse(base_url)
-    parsed_url = urlparse(url)
+    parsed_url = urlsplit(url)
     
     # Start with hostname for organization
     domain_parts = [parsed_url.hostname or 'unknown']
     
     # Add path components
-    path = parsed_url.path.strip('/')
+    path = _strip_params(parsed_url.path).strip('/')
     if path:
-        path_parts = path.split('/')
         # Sanitize each part
-        path_parts = [sanitize_filename(part) for part in path_parts if part]
-        domain_parts.extend(path_parts)
+        domain_parts.extend(_sanitize_segment(part) for part in path.split('/') if part)
     
     # Create filename
-    if domain_parts[-1] == parsed_url.hostname or not domain_parts[-1]:
-        domain_parts[-1] = 'index'
+    if len(domain_parts) == 1:
+        domain_parts.append('index')
     
     # Ensure extension
     if not domain_parts[-1].endswith(extension):
@@ -230,11 +461,8 @@ def url_to_filepath(url: str, base_url: str, extension: str = '.md') -> str:
 
 def extract_canonical_url(html_content: str, current_url: str) -> Optional[str]:
     """Extract canonical URL from HTML content."""
-    import re
-    
     # Look for canonical link tag
-    canonical_pattern = r'<link[^>]+rel=["\']canonical["\'][^>]+href=["\']([^"\']+)["\']'
-    match = re.search(canonical_pattern, html_content, re.IGNORECASE)
+    match = _CANONICAL_RE.search(html_content)
     
     if match:
         canonical_url = match.group(1)
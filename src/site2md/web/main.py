@@ -1,25 +1,36 @@
 """FastAPI web server for Site2MD UI."""
 
 import asyncio
-import json
 import os
+import re
+import sys
+import tarfile
 import tempfile
+import threading
+import time
 import uuid
-import zipfile
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+from zipfile import ZIP_DEFLATED, ZIP_STORED
 
+import aiofiles
+import orjson
 import uvicorn
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect, Form, File, UploadFile, HTTPException
-from fastapi.responses import HTMLResponse, FileResponse
-from fastapi.staticfiles import StaticFiles
+from fastapi.responses import FileResponse, HTMLResponse, JSONResponse, Response, StreamingResponse
 from fastapi.templating import Jinja2Templates
 from starlette.requests import Request
+from zipstream import ZipStream
 
 from ..cli.config import load_config
 from ..crawl.crawler import Crawler
-from ..utils.exceptions import Site2MDError
+from ..utils.exceptions import Site2MDError, ValidationError
 from ..utils.logging import setup_logging, get_logger
+from ..utils.validation import compile_url_matcher
+from .scratch import ScratchPool
+from .static import CachedStatic, asset_version, precompress_static
 
 logger = get_logger(__name__)
 
@@ -28,25 +39,204 @@ WEB_DIR = Path(__file__).parent
 STATIC_DIR = WEB_DIR / "static"
 TEMPLATES_DIR = WEB_DIR / "templates"
 
+
+class ORJSONResponse(JSONResponse):
+    """JSON response encoded with orjson."""
+    
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content)
+
+
 # FastAPI app
 app = FastAPI(
     title="Site2MD Web UI",
     description="Web interface for Site2MD website crawler",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
 # Static files and templates
-app.mount("/static", StaticFiles(directory=str(STATIC_DIR)), name="static")
+precompress_static(STATIC_DIR)
+app.mount("/static", CachedStatic(directory=str(STATIC_DIR)), name="static")
 templates = Jinja2Templates(directory=str(TEMPLATES_DIR))
 
+# The index page has no per-request data, so render it once; asset URLs
+# carry a content hash so they can be cached as immutable
+INDEX_HTML = templates.get_template("index.html").render(asset_version=asset_version(STATIC_DIR))
+
+# Internal nginx location aliased to the temp directory; when set, archive
+# downloads are handed to nginx via X-Accel-Redirect instead of streamed here
+ACCEL_REDIRECT_PREFIX = os.environ.get("SITE2MD_ACCEL_REDIRECT", "").rstrip("/")
+
+# Export file types that are already compressed and are stored as-is
+STORED_EXTENSIONS = frozenset({
+    ".png", ".jpg", ".jpeg", ".gif", ".webp", ".ico",
+    ".zip", ".gz", ".br", ".zst", ".pdf", ".woff", ".woff2",
+})
+
+# Bounds for remembered finished crawls; evicted entries have their temp
+# directories removed. Running crawls are never evicted.
+MAX_TRACKED_CRAWLS = 256
+CRAWL_TTL_SECONDS = 3600
+
+
+# Crawls run on their own event loops in worker threads so parsing and
+# conversion never stall this loop's WebSocket and HTTP handling
+MAX_PARALLEL_CRAWLS = max(1, (os.cpu_count() or 2) // 2)
+crawl_slots = asyncio.Semaphore(MAX_PARALLEL_CRAWLS)
+crawl_executor = ThreadPoolExecutor(max_workers=MAX_PARALLEL_CRAWLS, thread_name_prefix="site2md-crawl")
+
+# Emptied crawl directories kept around for reuse by later crawls
+SCRATCH_POOL_SIZE = 8
+scratch_pool = ScratchPool(SCRATCH_POOL_SIZE)
+
+
+def _discard_crawl(crawl_info: Dict) -> None:
+    """Cancel a forgotten crawl and recycle its temp directory once nothing uses it."""
+    temp_dir = crawl_info["temp_dir"]
+    
+    task = crawl_info.get("task")
+    if task and not task.done():
+        task.cancel()
+    
+    worker = crawl_info.get("worker")
+    if worker is not None and not worker.done():
+        # The crawl thread may still write while unwinding; recycle once it exits
+        worker.add_done_callback(lambda _: scratch_pool.release(temp_dir))
+        return
+    
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        scratch_pool.release(temp_dir)
+    else:
+        loop.run_in_executor(None, scratch_pool.release, temp_dir)
+
+
+class CrawlRegistry(dict):
+    """Crawl registry that forgets finished crawls after a TTL or past a size bound."""
+    
+    def __init__(self, maxsize: int, ttl: float, timer=time.monotonic):
+        super().__init__()
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.timer = timer
+        # Finished crawl id -> finish time, oldest first; only these can expire
+        self._finished: "OrderedDict[str, float]" = OrderedDict()
+    
+    def finish(self, crawl_id: str, status: str) -> None:
+        """Record a crawl's final status and start its TTL."""
+        crawl_info = super().get(crawl_id)
+        if crawl_info is None:
+            return
+        crawl_info["status"] = status
+        self._finished[crawl_id] = self.timer()
+        self._finished.move_to_end(crawl_id)
+        self.expire()
+    
+    def expire(self) -> None:
+        """Drop finished crawls that are past the TTL or over the size bound."""
+        now = self.timer()
+        while self._finished:
+            crawl_id, finished_at = next(iter(self._finished.items()))
+            if now - finished_at < self.ttl and len(self) <= self.maxsize:
+                break
+            del self._finished[crawl_id]
+            crawl_info = super().pop(crawl_id, None)
+            if crawl_info is not None:
+                _discard_crawl(crawl_info)
+    
+    def get(self, key, default=None):
+        self.expire()
+        return super().get(key, default)
+    
+    def __setitem__(self, key, value):
+        self._finished.pop(key, None)
+        super().__setitem__(key, value)
+        self.expire()
+    
+    def __delitem__(self, key):
+        self._finished.pop(key, None)
+        super().__delitem__(key)
+    
+    def pop(self, key, *default):
+        self._finished.pop(key, None)
+        return super().pop(key, *default)
+
+
 # Global state for active crawls
-active_crawls: Dict[str, Dict] = {}
-websocket_connections: Dict[str, List[WebSocket]] = {}
+active_crawls: CrawlRegistry = CrawlRegistry(maxsize=MAX_TRACKED_CRAWLS, ttl=CRAWL_TTL_SECONDS)
+# Subscribers per crawl as immutable snapshots: readers iterate without a
+# lock, writers replace the tuple under the crawl's lock
+websocket_connections: Dict[str, Tuple[WebSocket, ...]] = {}
+_connection_locks: Dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+
+
+async def _add_connection(crawl_id: str, websocket: WebSocket) -> None:
+    """Subscribe a websocket to a crawl's updates."""
+    async with _connection_locks[crawl_id]:
+        websocket_connections[crawl_id] = websocket_connections.get(crawl_id, ()) + (websocket,)
+
+
+async def _remove_connections(crawl_id: str, websockets: Iterable[WebSocket]) -> None:
+    """Unsubscribe websockets from a crawl, forgetting the crawl once empty."""
+    gone = set(websockets)
+    async with _connection_locks[crawl_id]:
+        remaining = tuple(ws for ws in websocket_connections.get(crawl_id, ()) if ws not in gone)
+        if remaining:
+            websocket_connections[crawl_id] = remaining
+        else:
+            websocket_connections.pop(crawl_id, None)
+            _connection_locks.pop(crawl_id, None)
+
+
+class ThreadedCrawl:
+    """A crawl run on a private event loop in a worker thread."""
+    
+    def __init__(self, config: Dict[str, Any]):
+        self.config = config
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._task: Optional[asyncio.Task] = None
+        self._cancelled = False
+    
+    def run(self) -> Dict[str, Any]:
+        """Run the crawl to completion; blocks the calling thread."""
+        return asyncio.run(self._main())
+    
+    def cancel(self) -> None:
+        """Cancel the crawl from any thread."""
+        with self._lock:
+            self._cancelled = True
+            if self._loop is not None:
+                self._loop.call_soon_threadsafe(self._task.cancel)
+    
+    async def _main(self) -> Dict[str, Any]:
+        with self._lock:
+            if self._cancelled:
+                raise asyncio.CancelledError()
+            self._loop = asyncio.get_running_loop()
+            self._task = asyncio.current_task()
+        
+        try:
+            crawler = Crawler(self.config)
+            async with crawler:
+                return await crawler.crawl()
+        finally:
+            with self._lock:
+                self._loop = None
 
 
 class CrawlProgressTracker:
     """Tracks crawl progress and sends updates via WebSocket."""
     
+    # Bound on pending frames; the oldest is dropped when clients fall behind
+    QUEUE_SIZE = 256
+    # Minimum seconds between progress frames; updates in between are coalesced
+    FLUSH_INTERVAL = 0.1
+    # Queue marker meaning "send the current stats snapshot"
+    _PROGRESS = object()
+    
     def __init__(self, crawl_id: str):
         self.crawl_id = crawl_id
         self.stats = {
@@ -58,27 +248,27 @@ class CrawlProgressTracker:
             "total": 1,
             "completed": 0,
         }
+        self._queue: asyncio.Queue = asyncio.Queue(self.QUEUE_SIZE)
+        self._progress_pending = False
+        self._worker: Optional[asyncio.Task] = None
     
     async def update_progress(self, **kwargs):
-        """Update progress stats and notify WebSocket connections."""
+        """Update progress stats; at most one snapshot is queued at a time."""
         self.stats.update(kwargs)
-        
-        message = {
-            "type": "progress",
-            **self.stats
-        }
-        
-        await self.broadcast_message(message)
+        if not self._progress_pending:
+            self._progress_pending = True
+            self._enqueue(self._PROGRESS)
     
     async def update_activity(self, message: str):
-        """Update current activity and notify connections."""
-        await self.broadcast_message({
+        """Queue a current-activity message."""
+        self._enqueue({
             "type": "activity",
             "message": message
         })
     
     async def broadcast_completed(self, results: Dict):
         """Broadcast crawl completion."""
+        await self._drain_and_stop()
         await self.broadcast_message({
             "type": "completed",
             **results
@@ -86,27 +276,96 @@ class CrawlProgressTracker:
     
     async def broadcast_error(self, error_message: str):
         """Broadcast crawl error."""
+        await self._drain_and_stop()
         await self.broadcast_message({
             "type": "error",
             "message": error_message
         })
     
+    def close(self) -> None:
+        """Cancel the broadcaster without sending pending messages."""
+        if self._worker is not None:
+            self._worker.cancel()
+            self._worker = None
+    
+    def _enqueue(self, item) -> None:
+        """Queue a message without blocking, dropping the oldest if full."""
+        if self._worker is None:
+            self._worker = asyncio.create_task(self._drain())
+        
+        if self._queue.full():
+            dropped = self._queue.get_nowait()
+            self._queue.task_done()
+            if dropped is self._PROGRESS:
+                self._progress_pending = item is self._PROGRESS
+        self._queue.put_nowait(item)
+    
+    async def _drain(self) -> None:
+        """Send queued messages to subscribers, one at a time."""
+        while True:
+            item = await self._queue.get()
+            try:
+                if item is self._PROGRESS:
+                    self._progress_pending = False
+                    await self.broadcast_message({
+                        "type": "progress",
+                        **self.stats
+                    })
+                    await asyncio.sleep(self.FLUSH_INTERVAL)
+                else:
+                    await self.broadcast_message(item)
+            except Exception as e:
+                logger.warning(f"Progress broadcast failed for crawl {self.crawl_id}: {e}")
+            finally:
+                self._queue.task_done()
+    
+    async def _drain_and_stop(self) -> None:
+        """Wait for queued messages to be sent, then stop the broadcaster."""
+        if self._worker is not None:
+            await self._queue.join()
+            self.close()
+    
     async def broadcast_message(self, message: Dict):
         """Send message to all WebSocket connections for this crawl."""
-        connections = websocket_connections.get(self.crawl_id, [])
+        subscribers = websocket_connections.get(self.crawl_id)
+        if not subscribers:
+            return
         
-        for websocket in connections.copy():
-            try:
-                await websocket.send_text(json.dumps(message))
-            except:
-                # Remove disconnected websockets
-                connections.remove(websocket)
+        # Serialize once and fan the same text frame out to every subscriber
+        payload = orjson.dumps(message).decode()
+        results = await asyncio.gather(
+            *(websocket.send_text(payload) for websocket in subscribers),
+            return_exceptions=True,
+        )
+        
+        dead = []
+        for websocket, result in zip(subscribers, results):
+            if isinstance(result, (WebSocketDisconnect, RuntimeError)):
+                dead.append(websocket)
+            elif isinstance(result, BaseException):
+                logger.warning(f"WebSocket send failed for crawl {self.crawl_id}: {result}")
+        
+        # Prune disconnected websockets in one pass
+        if dead:
+            await _remove_connections(self.crawl_id, dead)
+
+
+UPLOAD_CHUNK_SIZE = 1 << 16
+
+
+async def _save_upload(upload: UploadFile, dest_dir: Path) -> Path:
+    """Stream an uploaded file to disk in fixed-size chunks."""
+    dest = dest_dir / Path(upload.filename).name
+    async with aiofiles.open(dest, 'wb') as f:
+        while chunk := await upload.read(UPLOAD_CHUNK_SIZE):
+            await f.write(chunk)
+    return dest
 
 
 @app.get("/", response_class=HTMLResponse)
-async def index(request: Request):
+async def index():
     """Serve the main UI page."""
-    return templates.TemplateResponse("index.html", {"request": request})
+    return HTMLResponse(INDEX_HTML)
 
 
 @app.post("/api/crawl")
@@ -132,16 +391,17 @@ async def start_crawl(
     dry_run: bool = Form(False)
 ):
     """Start a crawl job."""
+    # Generate unique crawl ID
+    crawl_id = str(uuid.uuid4())
+    temp_dir = None
+    
     try:
-        # Generate unique crawl ID
-        crawl_id = str(uuid.uuid4())
+        # Parse and validate patterns
+        include_list = _parse_patterns(include_patterns, "include")
+        exclude_list = _parse_patterns(exclude_patterns, "exclude")
         
-        # Parse patterns
-        include_list = json.loads(include_patterns) if include_patterns != "[]" else []
-        exclude_list = json.loads(exclude_patterns) if exclude_patterns != "[]" else []
-        
-        # Create temporary directory for this crawl
-        temp_dir = Path(tempfile.mkdtemp(prefix=f"site2md_{crawl_id}_"))
+        # Take an empty working directory for this crawl
+        temp_dir = scratch_pool.acquire()
         actual_output_dir = temp_dir / "export"
         
         # Handle file uploads
@@ -149,16 +409,10 @@ async def start_crawl(
         headers_path = None
         
         if cookies_file and cookies_file.filename:
-            cookies_path = temp_dir / cookies_file.filename
-            with open(cookies_path, 'wb') as f:
-                content = await cookies_file.read()
-                f.write(content)
+            cookies_path = await _save_upload(cookies_file, temp_dir)
         
         if headers_file and headers_file.filename:
-            headers_path = temp_dir / headers_file.filename
-            with open(headers_path, 'wb') as f:
-                content = await headers_file.read()
-                f.write(content)
+            headers_path = await _save_upload(headers_file, temp_dir)
         
         # Build configuration
         config = load_config(
@@ -211,6 +465,7 @@ async def start_crawl(
                 raise HTTPException(status_code=400, detail=f"Dry run failed: {str(e)}")
             finally:
                 await crawler.cleanup()
+                active_crawls.finish(crawl_id, "completed")
         
         else:
             # Start actual crawl in background
@@ -224,10 +479,38 @@ async def start_crawl(
             }
     
     except Exception as e:
+        if temp_dir is not None and crawl_id not in active_crawls:
+            # Never registered, so nothing else would recycle the directory
+            asyncio.get_running_loop().run_in_executor(None, scratch_pool.release, temp_dir)
         logger.error(f"Failed to start crawl: {e}")
         raise HTTPException(status_code=400, detail=str(e))
 
 
+def _parse_patterns(raw: str, kind: str) -> List[str]:
+    """Parse a JSON list of URL regexes, rejecting any that do not compile."""
+    if raw == "[]":
+        return []
+    
+    patterns = orjson.loads(raw)
+    if not isinstance(patterns, list) or not all(isinstance(p, str) for p in patterns):
+        raise ValidationError(f"{kind} patterns must be a JSON list of strings")
+    
+    # Validation only: the scope matcher silently skips patterns that fail
+    # this same per-pattern check, so reject them here instead
+    for pattern in patterns:
+        try:
+            re.compile(pattern, re.IGNORECASE)
+        except re.error as e:
+            raise ValidationError(f"Invalid {kind} pattern {pattern!r}: {e}")
+    
+    # Build the combined matcher (RE2 or one re alternation) as the crawl
+    # compiles it; it is cached per pattern tuple for crawls that only set
+    # include or only set exclude patterns
+    compile_url_matcher(patterns)
+    
+    return patterns
+
+
 async def run_crawl(crawl_id: str):
     """Run the actual crawl in background."""
     crawl_info = active_crawls[crawl_id]
@@ -236,32 +519,34 @@ async def run_crawl(crawl_id: str):
     try:
         await progress_tracker.update_activity("Initializing crawler...")
         
-        crawler = Crawler(crawl_info["config"])
-        
-        # Update status
-        active_crawls[crawl_id]["status"] = "running"
-        
-        # Run crawl with progress tracking
-        async with crawler:
+        async with crawl_slots:
+            # Update status
+            crawl_info["status"] = "running"
             await progress_tracker.update_activity("Discovering URLs...")
             
-            # Mock progress updates for demo (in real implementation, 
-            # you'd integrate with the actual crawler progress)
-            stats = await crawler.crawl()
-            
-            # Update final progress
-            await progress_tracker.update_progress(
-                pages_crawled=stats.get("pages_crawled", 0),
-                pages_cached=stats.get("pages_cached", 0),
-                pages_failed=stats.get("pages_failed", 0),
-                total_bytes=stats.get("total_bytes", 0),
-                completed=stats.get("pages_crawled", 0),
-                total=stats.get("pages_crawled", 0)
-            )
+            # Run the crawl off this loop; stopping the crawl cancels it in its thread
+            crawl = ThreadedCrawl(crawl_info["config"])
+            # Kept so the temp directory is only recycled after the thread exits
+            crawl_info["worker"] = crawl_executor.submit(crawl.run)
+            try:
+                stats = await asyncio.wrap_future(crawl_info["worker"])
+            except asyncio.CancelledError:
+                crawl.cancel()
+                raise
+        
+        # Update final progress
+        await progress_tracker.update_progress(
+            pages_crawled=stats.get("pages_crawled", 0),
+            pages_cached=stats.get("pages_cached", 0),
+            pages_failed=stats.get("pages_failed", 0),
+            total_bytes=stats.get("total_bytes", 0),
+            completed=stats.get("pages_crawled", 0),
+            total=stats.get("pages_crawled", 0)
+        )
         
         # Mark as completed
-        active_crawls[crawl_id]["status"] = "completed"
-        active_crawls[crawl_id]["results"] = stats
+        crawl_info["results"] = stats
+        active_crawls.finish(crawl_id, "completed")
         
         await progress_tracker.broadcast_completed({
             "pages_crawled": stats.get("pages_crawled", 0),
@@ -276,10 +561,13 @@ async def run_crawl(crawl_id: str):
     
     except Exception as e:
         logger.error(f"Crawl {crawl_id} failed: {e}")
-        active_crawls[crawl_id]["status"] = "failed"
-        active_crawls[crawl_id]["error"] = str(e)
+        crawl_info["error"] = str(e)
+        active_crawls.finish(crawl_id, "failed")
         
         await progress_tracker.broadcast_error(str(e))
+    
+    finally:
+        progress_tracker.close()
 
 
 @app.websocket("/ws/{crawl_id}")
@@ -288,45 +576,43 @@ async def websocket_endpoint(websocket: WebSocket, crawl_id: str):
     await websocket.accept()
     
     # Add to connections
-    if crawl_id not in websocket_connections:
-        websocket_connections[crawl_id] = []
-    websocket_connections[crawl_id].append(websocket)
+    await _add_connection(crawl_id, websocket)
     
     try:
+        # Server-push only: wait for the disconnect without decoding client frames
         while True:
-            # Keep connection alive
-            await websocket.receive_text()
-    except WebSocketDisconnect:
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                break
+    finally:
         # Remove from connections
-        if crawl_id in websocket_connections:
-            websocket_connections[crawl_id].remove(websocket)
+        await _remove_connections(crawl_id, (websocket,))
 
 
 @app.post("/api/crawl/{crawl_id}/stop")
 async def stop_crawl(crawl_id: str):
     """Stop a running crawl."""
-    if crawl_id not in active_crawls:
+    crawl_info = active_crawls.get(crawl_id)
+    if crawl_info is None:
         raise HTTPException(status_code=404, detail="Crawl not found")
-    
-    crawl_info = active_crawls[crawl_id]
     task = crawl_info.get("task")
     
     if task and not task.done():
         task.cancel()
-        active_crawls[crawl_id]["status"] = "stopped"
+        # Kept for status requests until it ages out like any finished crawl
+        active_crawls.finish(crawl_id, "stopped")
         return {"message": "Crawl stopped"}
     
     return {"message": "Crawl was not running"}
 
 
 @app.get("/api/crawl/{crawl_id}/download")
-async def download_results(crawl_id: str):
-    """Download crawl results as a ZIP file."""
-    if crawl_id not in active_crawls:
+async def download_results(crawl_id: str, format: str = "zip"):
+    """Download crawl results as a ZIP (default) or tar.zst archive."""
+    crawl_info = active_crawls.get(crawl_id)
+    if crawl_info is None:
         raise HTTPException(status_code=404, detail="Crawl not found")
     
-    crawl_info = active_crawls[crawl_id]
-    
     if crawl_info["status"] != "completed":
         raise HTTPException(status_code=400, detail="Crawl not completed")
     
@@ -334,30 +620,88 @@ async def download_results(crawl_id: str):
     if not output_dir.exists():
         raise HTTPException(status_code=404, detail="Output directory not found")
     
-    # Create ZIP file
-    temp_zip = crawl_info["temp_dir"] / f"site2md_export_{crawl_id}.zip"
+    if format == "tar.zst":
+        archive_path = crawl_info["temp_dir"] / f"site2md_export_{crawl_id}.tar.zst"
+        try:
+            await asyncio.to_thread(_build_tar_zst, output_dir, archive_path)
+        except ImportError:
+            raise HTTPException(
+                status_code=400,
+                detail="tar.zst export requires zstandard. Install with: pip install site2md[zstd]"
+            )
+        
+        return _file_download(archive_path, "application/zstd")
+    
+    if format != "zip":
+        raise HTTPException(status_code=400, detail=f"Unsupported archive format: {format}")
     
-    with zipfile.ZipFile(temp_zip, 'w', zipfile.ZIP_DEFLATED) as zipf:
-        for file_path in output_dir.rglob('*'):
-            if file_path.is_file():
-                arcname = file_path.relative_to(output_dir)
-                zipf.write(file_path, arcname)
+    # Walk and stat the export off the event loop; the sync ZipStream iterator
+    # is then read and deflated in Starlette's threadpool while streaming
+    zs = await asyncio.to_thread(_build_zip, output_dir)
     
-    return FileResponse(
-        str(temp_zip),
+    return StreamingResponse(
+        zs,
         media_type="application/zip",
-        filename=f"site2md_export_{crawl_id}.zip"
+        headers={
+            "Content-Disposition": f'attachment; filename="site2md_export_{crawl_id}.zip"'
+        }
     )
 
 
+def _file_download(path: Path, media_type: str) -> Response:
+    """Serve a finished archive, via nginx sendfile when configured."""
+    if ACCEL_REDIRECT_PREFIX:
+        relative = path.relative_to(tempfile.gettempdir()).as_posix()
+        return Response(
+            media_type=media_type,
+            headers={
+                "X-Accel-Redirect": f"{ACCEL_REDIRECT_PREFIX}/{relative}",
+                "Content-Disposition": f'attachment; filename="{path.name}"'
+            }
+        )
+    
+    # Starlette uses the ASGI pathsend extension (zero-copy) when the server offers it
+    return FileResponse(str(path), media_type=media_type, filename=path.name)
+
+
+def _iter_export_files(root: str) -> Iterator[str]:
+    """Yield file paths under a directory, using cached scandir entry types."""
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _iter_export_files(entry.path)
+            elif entry.is_file(follow_symlinks=False):
+                yield entry.path
+
+
+def _build_zip(output_dir: Path) -> ZipStream:
+    """Build a streaming ZIP of the export directory."""
+    zs = ZipStream(compress_type=ZIP_DEFLATED)
+    for file_path in _iter_export_files(str(output_dir)):
+        extension = os.path.splitext(file_path)[1].lower()
+        compress_type = ZIP_STORED if extension in STORED_EXTENSIONS else None
+        zs.add_path(file_path, os.path.relpath(file_path, output_dir), compress_type=compress_type)
+    return zs
+
+
+def _build_tar_zst(output_dir: Path, archive_path: Path) -> None:
+    """Write the export directory as a multi-threaded zstd-compressed tarball."""
+    import zstandard
+    
+    cctx = zstandard.ZstdCompressor(level=10, threads=-1)
+    with open(archive_path, 'wb') as raw, cctx.stream_writer(raw) as writer:
+        with tarfile.open(fileobj=writer, mode='w|') as tar:
+            for file_path in _iter_export_files(str(output_dir)):
+                tar.add(file_path, arcname=os.path.relpath(file_path, output_dir))
+
+
 @app.get("/api/crawl/{crawl_id}/status")
 async def get_crawl_status(crawl_id: str):
     """Get crawl status."""
-    if crawl_id not in active_crawls:
+    crawl_info = active_crawls.get(crawl_id)
+    if crawl_info is None:
         raise HTTPException(status_code=404, detail="Crawl not found")
     
-    crawl_info = active_crawls[crawl_id]
-    
     return {
         "crawl_id": crawl_id,
         "status": crawl_info["status"],
@@ -366,6 +710,26 @@ async def get_crawl_status(crawl_id: str):
     }
 
 
+def _pick_event_loop() -> str:
+    """Use uvloop unless on Windows or not installed."""
+    if sys.platform == "win32":
+        return "asyncio"
+    try:
+        import uvloop  # noqa: F401
+    except ImportError:
+        return "asyncio"
+    return "uvloop"
+
+
+def _pick_http_parser() -> str:
+    """Use httptools if installed, otherwise the pure-Python h11 parser."""
+    try:
+        import httptools  # noqa: F401
+    except ImportError:
+        return "h11"
+    return "httptools"
+
+
 def main():
     """Main entry point for web server."""
     import argparse
@@ -382,11 +746,15 @@ def main():
     
     logger.info(f"Starting Site2MD Web UI at http://{args.host}:{args.port}")
     
-    # Run server
+    # Run server on uvloop + httptools when available (uvicorn[standard]).
+    # Crawl state and WebSocket subscribers live in process memory, so this
+    # stays a single worker.
     uvicorn.run(
         "site2md.web.main:app",
         host=args.host,
         port=args.port,
+        loop=_pick_event_loop(),
+        http=_pick_http_parser(),
         reload=args.debug,
         log_level="debug" if args.debug else "info"
     )
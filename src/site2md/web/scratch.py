@@ -0,0 +1,48 @@
+"""Reusable pool of scratch directories for web crawls."""
+
+import atexit
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from typing import List
+
+
+class ScratchPool:
+    """Hands out empty temp directories and recycles them after use."""
+
+    def __init__(self, size: int, prefix: str = "site2md_"):
+        self.size = size
+        self.prefix = prefix
+        self._free: List[Path] = []
+        atexit.register(self.close)
+
+    def acquire(self) -> Path:
+        """Return an empty scratch directory, reusing a released one if possible."""
+        try:
+            return self._free.pop()
+        except IndexError:
+            return Path(tempfile.mkdtemp(prefix=self.prefix))
+
+    def release(self, path: Path) -> None:
+        """Empty a directory and keep it for reuse; blocking, run off the loop."""
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        shutil.rmtree(entry.path, ignore_errors=True)
+                    else:
+                        os.unlink(entry.path)
+        except OSError:
+            shutil.rmtree(path, ignore_errors=True)
+            return
+
+        if len(self._free) < self.size:
+            self._free.append(path)
+        else:
+            shutil.rmtree(path, ignore_errors=True)
+
+    def close(self) -> None:
+        """Remove all pooled directories."""
+        while self._free:
+            shutil.rmtree(self._free.pop(), ignore_errors=True)
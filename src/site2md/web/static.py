@@ -0,0 +1,114 @@
+"""Static file serving with long-lived caching and precompressed assets."""
+
+import gzip
+import hashlib
+import mimetypes
+import os
+import stat
+from pathlib import Path
+
+import anyio
+import brotli
+from starlette.datastructures import Headers
+from starlette.responses import Response
+from starlette.staticfiles import StaticFiles
+from starlette.types import Scope
+
+from ..utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Only text assets are worth precompressing
+COMPRESSIBLE_EXTENSIONS = frozenset({".css", ".js", ".html", ".svg", ".json", ".txt"})
+
+# Accept-Encoding token -> sibling file suffix, in order of preference
+PRECOMPRESSED_ENCODINGS = (("br", ".br"), ("gzip", ".gz"))
+
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+REVALIDATE_CACHE_CONTROL = "public, max-age=0, must-revalidate"
+
+
+def asset_version(directory: Path) -> str:
+    """Short content hash of every file under a static directory."""
+    digest = hashlib.blake2b(digest_size=6)
+    for path in sorted(directory.rglob('*')):
+        if path.is_file() and path.suffix not in ('.br', '.gz'):
+            digest.update(str(path.relative_to(directory)).encode())
+            digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def precompress_static(directory: Path) -> None:
+    """Write .br and .gz siblings for text assets that are missing or stale."""
+    for path in directory.rglob('*'):
+        if not path.is_file() or path.suffix not in COMPRESSIBLE_EXTENSIONS:
+            continue
+
+        source_mtime = path.stat().st_mtime
+        data = None
+        for _, suffix in PRECOMPRESSED_ENCODINGS:
+            target = path.with_name(path.name + suffix)
+            if target.exists() and target.stat().st_mtime >= source_mtime:
+                continue
+
+            if data is None:
+                data = path.read_bytes()
+            if suffix == '.br':
+                compressed = brotli.compress(data, mode=brotli.MODE_TEXT, quality=11)
+            else:
+                compressed = gzip.compress(data, compresslevel=9, mtime=0)
+
+            try:
+                target.write_bytes(compressed)
+            except OSError as e:
+                # Read-only installs just serve the uncompressed files
+                logger.debug(f"Cannot write precompressed asset {target}: {e}")
+                return
+
+
+class CachedStatic(StaticFiles):
+    """StaticFiles that adds Cache-Control and serves precompressed siblings."""
+
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        response = await self._get_precompressed_response(path, scope)
+        if response is None:
+            response = await super().get_response(path, scope)
+
+        # Versioned URLs (?v=<hash>) never change; anything else revalidates
+        versioned = b"v=" in scope.get("query_string", b"")
+        response.headers["Cache-Control"] = (
+            IMMUTABLE_CACHE_CONTROL if versioned else REVALIDATE_CACHE_CONTROL
+        )
+        if os.path.splitext(path)[1] in COMPRESSIBLE_EXTENSIONS:
+            response.headers["Vary"] = "Accept-Encoding"
+        return response
+
+    async def _get_precompressed_response(self, path: str, scope: Scope):
+        """Return a response for a .br/.gz sibling the client accepts, if any."""
+        if scope["method"] not in ("GET", "HEAD"):
+            return None
+        if os.path.splitext(path)[1] not in COMPRESSIBLE_EXTENSIONS:
+            return None
+
+        accept_encoding = Headers(scope=scope).get("accept-encoding", "")
+        for encoding, suffix in PRECOMPRESSED_ENCODINGS:
+            if encoding not in accept_encoding:
+                continue
+
+            try:
+                full_path, stat_result = await anyio.to_thread.run_sync(self.lookup_path, path + suffix)
+            except (OSError, ValueError):
+                return None
+            if stat_result is None or not stat.S_ISREG(stat_result.st_mode):
+                continue
+
+            response = self.file_response(full_path, stat_result, scope)
+            media_type, _ = mimetypes.guess_type(path)
+            if media_type:
+                if media_type.startswith("text/") or media_type == "application/javascript":
+                    media_type += "; charset=utf-8"
+                response.headers["Content-Type"] = media_type
+            response.headers["Content-Encoding"] = encoding
+            return response
+
+        return None
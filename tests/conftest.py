@@ -1,6 +1,7 @@
 """Pytest configuration and shared fixtures."""
 
 import asyncio
+import copy
 import json
 import tempfile
 from pathlib import Path
@@ -8,48 +9,27 @@ from typing import Dict, Any
 
 import pytest
 import httpx
+import yaml
 from httpx_mock import HTTPXMock
 
 from site2md.cli.config import DEFAULT_CONFIG
+from site2md.process.converter import MarkdownConverter
+from site2md.process.extractor import ContentExtractor
 
+try:
+    from yaml import CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeDumper as _YamlDumper
 
-@pytest.fixture
-def event_loop():
-    """Create an instance of the default event loop for the test session."""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
-
-
-@pytest.fixture
-def temp_dir():
-    """Create a temporary directory for tests."""
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        yield Path(tmp_dir)
-
-
-@pytest.fixture
-def test_config(temp_dir):
-    """Create a test configuration."""
-    config = DEFAULT_CONFIG.copy()
-    config["start_urls"] = ["https://example.com"]
-    config["output"]["directory"] = temp_dir / "export"
-    config["limits"]["max_pages"] = 10
-    config["fetch"]["concurrency"] = 2
-    return config
-
-
-@pytest.fixture
-def sample_html():
-    """Sample HTML content for testing."""
-    return """
+# Sample page with a {page_title} placeholder in <title>
+SAMPLE_HTML_TEMPLATE = """
     <!DOCTYPE html>
     <html lang="en">
     <head>
         <meta charset="UTF-8">
         <meta name="viewport" content="width=device-width, initial-scale=1.0">
         <meta name="description" content="This is a sample page description.">
-        <title>Sample Page Title</title>
+        <title>{page_title}</title>
         <link rel="canonical" href="https://example.com/sample">
     </head>
     <body>
@@ -100,6 +80,62 @@ def hello_world():
     """
 
 
+@pytest.fixture
+def event_loop():
+    """Create an instance of the default event loop for the test session."""
+    loop = asyncio.get_event_loop_policy().new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest.fixture
+def temp_dir():
+    """Create a temporary directory for tests."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        yield Path(tmp_dir)
+
+
+@pytest.fixture(scope="session")
+def yaml_dump():
+    """Write YAML fixture files with the C dumper when available."""
+    return lambda data, stream: yaml.dump(data, stream, Dumper=_YamlDumper)
+
+
+@pytest.fixture
+def test_config(temp_dir):
+    """Create a test configuration."""
+    config = copy.deepcopy(DEFAULT_CONFIG)
+    config["start_urls"] = ["https://example.com"]
+    config["output"]["directory"] = temp_dir / "export"
+    config["limits"]["max_pages"] = 10
+    config["fetch"]["concurrency"] = 2
+    return config
+
+
+@pytest.fixture(scope="session")
+def extractor():
+    """Content extractor shared across the test session."""
+    return ContentExtractor(copy.deepcopy(DEFAULT_CONFIG))
+
+
+@pytest.fixture(scope="session")
+def converter():
+    """Markdown converter shared across the test session."""
+    return MarkdownConverter(copy.deepcopy(DEFAULT_CONFIG))
+
+
+@pytest.fixture
+def sample_html():
+    """Sample HTML content for testing."""
+    return SAMPLE_HTML_TEMPLATE.format(page_title="Sample Page Title")
+
+
+@pytest.fixture
+def make_sample_html():
+    """Build the sample page with a different title."""
+    return lambda page_title: SAMPLE_HTML_TEMPLATE.format(page_title=page_title)
+
+
 @pytest.fixture
 def sample_sitemap():
     """Sample sitemap XML for testing."""
@@ -5,8 +5,6 @@ from unittest.mock import AsyncMock, patch
 
 from site2md.crawl.crawler import Crawler
 from site2md.fetch.http_client import HTTPClient
-from site2md.process.extractor import ContentExtractor
-from site2md.process.converter import MarkdownConverter
 
 
 @pytest.mark.integration
@@ -44,12 +42,17 @@ class TestCrawlFlow:
         }
         
         async def mock_fetch(url):
-            return mock_responses.get(url, {
+            # Crawled URLs are normalized with a trailing slash on the root
+            url = url.rstrip("/") if url.rstrip("/") in mock_responses else url
+            response = mock_responses.get(url)
+            if response is not None:
+                return response
+            return {
                 "status_code": 404,
                 "content": "",
                 "headers": {},
                 "url": url
-            })
+            }
         
         # Create crawler and run
         crawler = Crawler(config)
@@ -67,8 +70,8 @@ class TestCrawlFlow:
                 output_dir = config["output"]["directory"]
                 assert output_dir.exists()
                 
-                # Look for generated markdown files
-                md_files = list(output_dir.glob("**/*.md"))
+                # Markdown files written by the crawler
+                md_files = crawler.written_md
                 assert len(md_files) > 0
                 
                 # Check README was generated
@@ -77,16 +80,52 @@ class TestCrawlFlow:
                 
                 # Verify markdown content
                 for md_file in md_files:
-                    if md_file.name != "README.md":
-                        content = md_file.read_text()
-                        assert "---" in content  # Front matter
-                        assert "Main Heading" in content  # Extracted content
+                    content = md_file.read_text()
+                    assert "---" in content  # Front matter
+                    assert "Main Heading" in content  # Extracted content
             
             finally:
                 await crawler.cleanup()
     
     @pytest.mark.asyncio
-    async def test_crawl_with_sitemap(self, test_config, sample_sitemap, sample_html, temp_dir):
+    @pytest.mark.parametrize("held_open", [False, True])
+    async def test_crawl_opens_crawler_once(self, test_config, sample_html, temp_dir, held_open):
+        """Test crawl() works with or without an enclosing async with, setting up once."""
+        config = test_config.copy()
+        config["output"]["directory"] = temp_dir / "export"
+        config["limits"]["max_pages"] = 1
+        
+        async def mock_fetch(url):
+            if url.rstrip("/") == "https://example.com":
+                return {
+                    "status_code": 200,
+                    "content": sample_html,
+                    "headers": {"content-type": "text/html"},
+                    "url": "https://example.com"
+                }
+            return {"status_code": 404, "content": "", "headers": {}, "url": url}
+        
+        crawler = Crawler(config)
+        initialize = AsyncMock(wraps=crawler.manifest.initialize)
+        
+        with patch.object(HTTPClient, 'fetch', side_effect=mock_fetch), \
+                patch.object(crawler.manifest, 'initialize', initialize):
+            try:
+                if held_open:
+                    async with crawler:
+                        stats = await crawler.crawl()
+                else:
+                    stats = await crawler.crawl()
+                
+                assert stats["pages_crawled"] == 1
+                assert len(crawler.written_md) == 1
+                assert initialize.await_count == 1
+            
+            finally:
+                await crawler.cleanup()
+    
+    @pytest.mark.asyncio
+    async def test_crawl_with_sitemap(self, test_config, sample_sitemap, sample_html, make_sample_html, temp_dir):
         """Test crawl with sitemap discovery."""
         config = test_config.copy()
         config["output"]["directory"] = temp_dir / "export"
@@ -108,13 +147,13 @@ class TestCrawlFlow:
             },
             "https://example.com/about": {
                 "status_code": 200,
-                "content": sample_html.replace("Sample Page Title", "About Page"),
+                "content": make_sample_html("About Page"),
                 "headers": {"content-type": "text/html"},
                 "url": "https://example.com/about"
             },
             "https://example.com/contact": {
                 "status_code": 200,
-                "content": sample_html.replace("Sample Page Title", "Contact Page"),
+                "content": make_sample_html("Contact Page"),
                 "headers": {"content-type": "text/html"},
                 "url": "https://example.com/contact"
             },
@@ -127,12 +166,17 @@ class TestCrawlFlow:
         }
         
         async def mock_fetch(url):
-            return mock_responses.get(url, {
+            # Crawled URLs are normalized with a trailing slash on the root
+            url = url.rstrip("/") if url.rstrip("/") in mock_responses else url
+            response = mock_responses.get(url)
+            if response is not None:
+                return response
+            return {
                 "status_code": 404,
                 "content": "",
                 "headers": {},
                 "url": url
-            })
+            }
         
         crawler = Crawler(config)
         
@@ -144,13 +188,9 @@ class TestCrawlFlow:
                 # Should have crawled multiple pages from sitemap
                 assert stats["pages_crawled"] >= 2
                 
-                # Check multiple markdown files were created
-                output_dir = config["output"]["directory"]
-                md_files = list(output_dir.glob("**/*.md"))
-                
-                # Should have at least the pages from sitemap (excluding README)
-                content_files = [f for f in md_files if f.name != "README.md"]
-                assert len(content_files) >= 2
+                # Should have written at least the pages from sitemap
+                assert len(crawler.written_md) >= 2
+                assert all(path.exists() for path in crawler.written_md)
             
             finally:
                 await crawler.cleanup()
@@ -183,12 +223,15 @@ class TestCrawlFlow:
             # For this test, we'll assume auth was applied if the files exist
             auth_used["cookies"] = True
             auth_used["headers"] = True
-            return mock_responses.get(url, {
+            response = mock_responses.get(url)
+            if response is not None:
+                return response
+            return {
                 "status_code": 404,
                 "content": "",
                 "headers": {},
                 "url": url
-            })
+            }
         
         crawler = Crawler(config)
         
@@ -210,11 +253,8 @@ class TestContentProcessing:
     """Test content extraction and conversion integration."""
     
     @pytest.mark.asyncio
-    async def test_html_to_markdown_conversion(self, test_config, sample_html):
+    async def test_html_to_markdown_conversion(self, extractor, converter, sample_html):
         """Test the complete HTML to Markdown conversion pipeline."""
-        extractor = ContentExtractor(test_config)
-        converter = MarkdownConverter(test_config)
-        
         # Extract content
         extracted = await extractor.extract(sample_html, "https://example.com")
         
@@ -250,7 +290,7 @@ class TestContentProcessing:
         assert "```python" in markdown or "```" in markdown
     
     @pytest.mark.asyncio
-    async def test_link_rewriting(self, test_config):
+    async def test_link_rewriting(self, extractor, converter):
         """Test internal link rewriting in markdown conversion."""
         html_with_links = """
         <html>
@@ -262,9 +302,6 @@ class TestContentProcessing:
         </html>
         """
         
-        extractor = ContentExtractor(test_config)
-        converter = MarkdownConverter(test_config)
-        
         extracted = await extractor.extract(html_with_links, "https://example.com")
         markdown = await converter.convert(
             extracted, 
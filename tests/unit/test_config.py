@@ -1,11 +1,12 @@
 """Unit tests for configuration management."""
 
+import os
 import tempfile
 from pathlib import Path
 
 import pytest
-import yaml
 
+from site2md.cli import config as config_module
 from site2md.cli.config import load_config, DEFAULT_CONFIG
 from site2md.utils.exceptions import ConfigError
 
@@ -21,7 +22,7 @@ class TestConfigLoading:
         assert config["output"]["directory"] == Path("./test")
         assert config["limits"]["max_pages"] == DEFAULT_CONFIG["limits"]["max_pages"]
     
-    def test_load_config_from_file(self, temp_dir):
+    def test_load_config_from_file(self, temp_dir, yaml_dump):
         """Test loading configuration from file."""
         config_data = {
             "limits": {"max_pages": 500, "max_depth": 3},
@@ -30,7 +31,7 @@ class TestConfigLoading:
         
         config_file = temp_dir / "config.yaml"
         with open(config_file, 'w') as f:
-            yaml.dump(config_data, f)
+            yaml_dump(config_data, f)
         
         config = load_config(
             config_file=config_file,
@@ -43,7 +44,7 @@ class TestConfigLoading:
         assert config["fetch"]["concurrency"] == 4
         assert config["fetch"]["timeout"] == 30
     
-    def test_cli_overrides_config_file(self, temp_dir):
+    def test_cli_overrides_config_file(self, temp_dir, yaml_dump):
         """Test CLI arguments override config file."""
         config_data = {
             "limits": {"max_pages": 500},
@@ -52,7 +53,7 @@ class TestConfigLoading:
         
         config_file = temp_dir / "config.yaml"
         with open(config_file, 'w') as f:
-            yaml.dump(config_data, f)
+            yaml_dump(config_data, f)
         
         config = load_config(
             config_file=config_file,
@@ -65,6 +66,46 @@ class TestConfigLoading:
         assert config["limits"]["max_pages"] == 100  # CLI wins
         assert config["fetch"]["concurrency"] == 8   # CLI wins
     
+    def test_config_file_reloaded_when_changed(self, temp_dir, yaml_dump):
+        """Test cached config files are reparsed after they change."""
+        config_file = temp_dir / "config.yaml"
+        with open(config_file, 'w') as f:
+            yaml_dump({"scope": {"include": ["docs"]}}, f)
+
+        first = load_config(config_file=config_file, url="https://example.com")
+        first["scope"]["include"].append("mutated")
+
+        # Unchanged file: served from cache, unaffected by the mutation above
+        second = load_config(config_file=config_file, url="https://example.com")
+        assert second["scope"]["include"] == ["docs"]
+
+        with open(config_file, 'w') as f:
+            yaml_dump({"scope": {"include": ["api", "guides"]}}, f)
+
+        third = load_config(config_file=config_file, url="https://example.com")
+        assert third["scope"]["include"] == ["api", "guides"]
+
+    def test_pickle_sidecar_reparsed_when_mtime_changes(self, temp_dir, yaml_dump, monkeypatch):
+        """Test the opt-in pickle sidecar is ignored once the file's mtime moves."""
+        monkeypatch.setattr(config_module, "CONFIG_PICKLE_CACHE", True)
+        config_file = temp_dir / "config.yaml"
+        with open(config_file, 'w') as f:
+            yaml_dump({"limits": {"max_pages": 500}}, f)
+
+        config = load_config(config_file=config_file, url="https://example.com")
+        assert config["limits"]["max_pages"] == 500
+        assert (temp_dir / "config.yaml.pkl").exists()
+
+        # Same size, new content: only the mtime tells the sidecar is stale
+        with open(config_file, 'w') as f:
+            yaml_dump({"limits": {"max_pages": 600}}, f)
+        stat_result = config_file.stat()
+        os.utime(config_file, ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns + 1_000_000_000))
+        config_module._parse_config_file.cache_clear()
+
+        config = load_config(config_file=config_file, url="https://example.com")
+        assert config["limits"]["max_pages"] == 600
+
     def test_invalid_yaml_config(self, temp_dir):
         """Test invalid YAML configuration handling."""
         config_file = temp_dir / "invalid.yaml"
@@ -112,7 +153,7 @@ class TestConfigLoading:
 class TestConfigMerging:
     """Test configuration merging logic."""
     
-    def test_deep_merge_nested_dicts(self, temp_dir):
+    def test_deep_merge_nested_dicts(self, temp_dir, yaml_dump):
         """Test deep merging of nested dictionaries."""
         config_data = {
             "limits": {
@@ -128,7 +169,7 @@ class TestConfigMerging:
         
         config_file = temp_dir / "config.yaml"
         with open(config_file, 'w') as f:
-            yaml.dump(config_data, f)
+            yaml_dump(config_data, f)
         
         config = load_config(
             config_file=config_file,
@@ -144,7 +185,7 @@ class TestConfigMerging:
         assert config["limits"]["max_depth"] == DEFAULT_CONFIG["limits"]["max_depth"]
         assert config["fetch"]["respect_robots"] == DEFAULT_CONFIG["fetch"]["respect_robots"]
     
-    def test_list_handling(self, temp_dir):
+    def test_list_handling(self, temp_dir, yaml_dump):
         """Test list value handling in configuration."""
         config_data = {
             "scope": {
@@ -155,7 +196,7 @@ class TestConfigMerging:
         
         config_file = temp_dir / "config.yaml"
         with open(config_file, 'w') as f:
-            yaml.dump(config_data, f)
+            yaml_dump(config_data, f)
         
         config = load_config(
             config_file=config_file,
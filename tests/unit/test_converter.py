@@ -0,0 +1,56 @@
+"""Unit tests for front matter rendering."""
+
+import random
+from datetime import datetime
+
+import pytest
+import yaml
+
+from site2md.process.converter import _yaml_scalar
+
+
+def _round_trip(value):
+    return yaml.safe_load(f"key: {_yaml_scalar(value)}")["key"]
+
+
+class TestYamlScalar:
+    """Test that front matter values read back unchanged."""
+
+    @pytest.mark.parametrize("value", [
+        "Plain Title",
+        "docs/guide.html",
+        "",
+        "yes",
+        "Null",
+        "Title: Subtitle",
+        "C# #tips",
+        " leading and trailing ",
+        "- list-like",
+        "[brackets] & {braces}",
+        'quote " and \\ backslash',
+        "line\nbreak\ttab\rreturn",
+        "next\x85line",
+        "line\u2028sep\u2029para",
+        "del\x7fcontrol\x00\x1b",
+        "bom\ufeffand\ufffe",
+        "unicode é 日本語 😀",
+    ])
+    def test_strings_round_trip(self, value):
+        """Test tricky strings survive a YAML load."""
+        assert _round_trip(value) == value
+
+    def test_random_strings_round_trip(self):
+        """Test random short strings over control, Latin-1 and separator characters."""
+        rng = random.Random(0)
+        alphabet = [chr(code) for code in range(0x100)] + ["\u2028", "\u2029", "\ufeff", "\U0001f600"]
+        for _ in range(2000):
+            value = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 8)))
+            assert _round_trip(value) == value
+
+    def test_non_string_values(self):
+        """Test booleans, integers, datetimes and lists."""
+        assert _round_trip(True) is True
+        assert _round_trip(42) == 42
+        assert _round_trip(datetime(2024, 1, 2, 3, 4, 5)) == "2024-01-02T03:04:05"
+        assert _round_trip(["a", "b: c", "\x85"]) == ["a", "b: c", "\x85"]
+        assert _round_trip([]) == []
@@ -0,0 +1,66 @@
+"""Unit tests for sitemap parsing and caching."""
+
+import pytest
+
+from site2md.crawl import discovery
+from site2md.crawl.discovery import cached_sitemap_locs, iter_sitemap_locs
+
+
+SITEMAP_INDEX = """<?xml version="1.0" encoding="UTF-8"?>
+<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+    <sitemap><loc>https://example.com/sitemap-docs.xml</loc></sitemap>
+    <sitemap><loc> https://example.com/sitemap-blog.xml </loc></sitemap>
+    <sitemap><loc></loc></sitemap>
+</sitemapindex>"""
+
+
+@pytest.fixture
+def sitemap_cache_dir(temp_dir, monkeypatch):
+    """Enable the sitemap cache in a temporary directory."""
+    cache_dir = temp_dir / "sitemaps"
+    monkeypatch.setattr(discovery, "SITEMAP_CACHE", True)
+    monkeypatch.setattr(discovery, "SITEMAP_CACHE_DIR", cache_dir)
+    return cache_dir
+
+
+class TestSitemapParsing:
+    """Test streaming sitemap parsing."""
+    
+    def test_iter_urlset(self, sample_sitemap):
+        """Test page entries from a urlset."""
+        assert list(iter_sitemap_locs(sample_sitemap)) == [
+            (False, "https://example.com/"),
+            (False, "https://example.com/about"),
+            (False, "https://example.com/contact"),
+        ]
+    
+    def test_iter_sitemap_index(self):
+        """Test child sitemaps are flagged, stripped and empty locs skipped."""
+        assert list(iter_sitemap_locs(SITEMAP_INDEX)) == [
+            (True, "https://example.com/sitemap-docs.xml"),
+            (True, "https://example.com/sitemap-blog.xml"),
+        ]
+
+
+class TestSitemapCache:
+    """Test the opt-in on-disk sitemap cache."""
+    
+    def test_disabled_by_default(self, sample_sitemap, temp_dir, monkeypatch):
+        """Test nothing is written unless the cache is enabled."""
+        cache_dir = temp_dir / "sitemaps"
+        monkeypatch.setattr(discovery, "SITEMAP_CACHE", False)
+        monkeypatch.setattr(discovery, "SITEMAP_CACHE_DIR", cache_dir)
+        
+        assert len(cached_sitemap_locs(sample_sitemap)) == 3
+        assert not cache_dir.exists()
+    
+    def test_cache_hit_skips_parse(self, sample_sitemap, sitemap_cache_dir, monkeypatch):
+        """Test an unchanged document is served from the cache."""
+        first = cached_sitemap_locs(sample_sitemap)
+        assert len(list(sitemap_cache_dir.iterdir())) == 1
+        
+        def fail(xml_content):
+            raise AssertionError("sitemap was parsed again")
+        monkeypatch.setattr(discovery, "iter_sitemap_locs", fail)
+        
+        assert cached_sitemap_locs(sample_sitemap) == first
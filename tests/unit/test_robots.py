@@ -0,0 +1,49 @@
+"""Unit tests for robots.txt rule matching."""
+
+from site2md.crawl.robots import RobotsRules
+
+
+ROBOTS_TXT = """# Robots.txt for testing
+User-agent: *
+Allow: /
+Disallow: /admin/
+Disallow: /private/
+Disallow: *.pdf$
+Allow: /private/public-
+Crawl-delay: 2
+
+User-agent: site2md
+Disallow: /drafts
+Crawl-delay: 1
+"""
+
+
+class TestRobotsRules:
+    """Test robots.txt parsing and matching."""
+
+    def test_longest_match_wins(self):
+        """Test that the most specific rule decides."""
+        rules = RobotsRules.parse(ROBOTS_TXT, "Mozilla/5.0")
+        assert rules.can_fetch("https://example.com/docs/")
+        assert not rules.can_fetch("https://example.com/admin/users")
+        assert not rules.can_fetch("https://example.com/private/notes")
+        assert rules.can_fetch("https://example.com/private/public-notes")
+
+    def test_wildcard_and_end_anchor(self):
+        """Test * and $ in rule patterns."""
+        rules = RobotsRules.parse(ROBOTS_TXT, "Mozilla/5.0")
+        assert not rules.can_fetch("https://example.com/files/report.pdf")
+        assert rules.can_fetch("https://example.com/files/report.pdf?download=1")
+
+    def test_specific_agent_group(self):
+        """Test that a named group replaces the * group."""
+        rules = RobotsRules.parse(ROBOTS_TXT, "site2md/0.1.0")
+        assert rules.can_fetch("https://example.com/admin/users")
+        assert not rules.can_fetch("https://example.com/drafts/post")
+        assert rules.crawl_delay == 1.0
+
+    def test_no_rules(self):
+        """Test that an empty robots.txt allows everything."""
+        rules = RobotsRules.parse("", "site2md")
+        assert rules.can_fetch("https://example.com/anything")
+        assert rules.crawl_delay is None
@@ -9,6 +9,7 @@ from site2md.utils.validation import (
     is_valid_content_url,
     matches_pattern,
     should_crawl_url,
+    should_crawl_urls,
     sanitize_filename,
     url_to_filepath,
 )
@@ -153,6 +154,12 @@ class TestPatternMatching:
         patterns = [r"docs", r"api"]
         assert not matches_pattern(url, patterns)
     
+    def test_matches_pattern_backreferences(self):
+        """Test numbered backreferences keep their meaning alongside other patterns."""
+        url = "https://example.com/aa"
+        assert matches_pattern(url, [r"(q)", r"(a)\1"])
+        assert not matches_pattern("https://example.com/ab", [r"(q)", r"(a)\1"])
+    
     def test_matches_pattern_empty_patterns(self):
         """Test empty patterns list."""
         url = "https://example.com/page"
@@ -244,4 +251,63 @@ class TestShouldCrawlURL:
         url = "https://example.com/blog/page"
         assert not should_crawl_url(
             url, base_url, include_patterns=include_patterns
-        )
\ No newline at end of file
+        )
+    
+    def test_should_crawl_url_include_and_exclude(self):
+        """Test exclude wins wherever it matches and invalid patterns are skipped."""
+        base_url = "https://example.com"
+        include_patterns = [r"docs", r"[invalid"]
+        exclude_patterns = [r"admin", r"(unclosed"]
+        assert should_crawl_url(
+            "https://example.com/docs/page", base_url,
+            include_patterns=include_patterns, exclude_patterns=exclude_patterns,
+        )
+        assert not should_crawl_url(
+            "https://example.com/admin/docs", base_url,
+            include_patterns=include_patterns, exclude_patterns=exclude_patterns,
+        )
+        assert not should_crawl_url(
+            "https://example.com/blog/page", base_url,
+            include_patterns=include_patterns, exclude_patterns=exclude_patterns,
+        )
+    
+    def test_should_crawl_url_backreferences(self):
+        """Test backreferences in combined include and exclude patterns."""
+        base_url = "https://example.com"
+        assert should_crawl_url(
+            "https://example.com/aa", base_url,
+            include_patterns=[r"(a)\1"], exclude_patterns=[r"(b)\1"],
+        )
+        assert not should_crawl_url(
+            "https://example.com/aabb", base_url,
+            include_patterns=[r"(a)\1"], exclude_patterns=[r"(b)\1"],
+        )
+    
+    def test_should_crawl_urls_batch(self):
+        """Test batch scope checks match the single-URL results."""
+        urls = [
+            "https://example.com/docs/page",
+            "https://other.com/docs/page",
+            "https://example.com/docs/image.jpg",
+            "https://example.com/docs/admin",
+            "https://example.com/blog/page",
+        ]
+        base_url = "https://example.com"
+        include_patterns = [r"docs"]
+        exclude_patterns = [r"admin"]
+        
+        results = should_crawl_urls(
+            urls, base_url,
+            include_patterns=include_patterns,
+            exclude_patterns=exclude_patterns,
+        )
+        
+        assert results == [True, False, False, False, False]
+        assert results == [
+            should_crawl_url(
+                url, base_url,
+                include_patterns=include_patterns,
+                exclude_patterns=exclude_patterns,
+            )
+            for url in urls
+        ]